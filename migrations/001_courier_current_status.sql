@@ -0,0 +1,21 @@
+-- 001: denormalized current status on Courier
+-- The latest Courier_tracking event is copied onto the courier row whenever a tracking
+-- row is written, so dashboards, views and "already delivered" checks read one row
+-- instead of sorting the history. Re-run trigger_procedure.sql after this migration so
+-- the procedures and triggers maintain the new columns.
+
+ALTER TABLE Courier
+  ADD COLUMN current_status VARCHAR(50) DEFAULT NULL,
+  ADD COLUMN current_location VARCHAR(100) DEFAULT NULL,
+  ADD COLUMN status_updated_at DATETIME DEFAULT NULL;
+
+-- Backfill from the existing history (latest by updated_at, then trackid)
+UPDATE Courier c
+JOIN (
+  SELECT cid, status, current_location, updated_at,
+         ROW_NUMBER() OVER (PARTITION BY cid ORDER BY updated_at DESC, trackid DESC) AS rn
+  FROM Courier_tracking
+) t ON t.cid = c.cid AND t.rn = 1
+SET c.current_status = t.status,
+    c.current_location = t.current_location,
+    c.status_updated_at = t.updated_at;
@@ -0,0 +1,25 @@
+-- 002: secondary indexes for the hot query patterns
+-- InnoDB already creates single-column indexes for foreign keys; these composite indexes
+-- also cover the ORDER BY / range part of each access path so it can be served from
+-- the index without a filesort or full scan.
+
+-- Tracking history by courier, newest first (track_courier, archival, latest-status backfill)
+CREATE INDEX ix_tracking_cid_updated ON Courier_tracking (cid, updated_at, trackid);
+
+-- Payment.query.filter_by(cid=...) on the payment page
+CREATE INDEX ix_payments_cid_status ON Payments (cid, payment_status);
+-- Admin payments table: keyset on (transaction_date, pid), optionally per status
+CREATE INDEX ix_payments_date_pid ON Payments (transaction_date, pid);
+CREATE INDEX ix_payments_status_date_pid ON Payments (payment_status, transaction_date, pid);
+
+-- User dashboard: Courier.filter_by(uid=...)
+CREATE INDEX ix_courier_uid_date ON Courier (uid, date, cid);
+-- Agent dashboard and agentid IS NULL (unassigned) scans, keyset-ordered
+CREATE INDEX ix_courier_agent_date ON Courier (agentid, date, cid);
+-- Admin couriers table: keyset on (date, cid), with status and type filters
+CREATE INDEX ix_courier_date_cid ON Courier (date, cid);
+CREATE INDEX ix_courier_status_date ON Courier (current_status, date, cid);
+CREATE INDEX ix_courier_type_date ON Courier (courier_type, date, cid);
+
+-- CourierPricing weight-band lookup in create_courier
+CREATE INDEX ix_pricing_type_weight ON Courier_pricing (courier_type, min_weight, max_weight);
@@ -0,0 +1,13 @@
+-- 003: shared cache version counters
+-- Worker processes keep some rarely-changing tables in memory (Courier_pricing first).
+-- Each cache has a row here that is bumped on every write to its source table
+-- (see the trg_pricing_* triggers in trigger_procedure.sql); workers poll the row
+-- cheaply and reload only when the version moves.
+
+CREATE TABLE IF NOT EXISTS Cache_version (
+  name VARCHAR(50) NOT NULL,
+  version INT NOT NULL DEFAULT 0,
+  PRIMARY KEY (name)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+INSERT IGNORE INTO Cache_version (name, version) VALUES ('pricing', 1);
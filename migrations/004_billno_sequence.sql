@@ -0,0 +1,17 @@
+-- 004: block-reserved bill number sequence
+-- create_courier used the current Unix time as billno, so two bookings in the same
+-- second collided on the UNIQUE constraint. Bill numbers now come from this sequence:
+-- each app process reserves a block of numbers with one UPDATE and hands them out from
+-- memory (BillnoAllocator in app.py).
+
+ALTER TABLE Courier MODIFY billno BIGINT NOT NULL;
+
+CREATE TABLE IF NOT EXISTS Billno_sequence (
+  name VARCHAR(50) NOT NULL,
+  next_value BIGINT NOT NULL,
+  PRIMARY KEY (name)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- Continue after the highest bill number already issued
+INSERT IGNORE INTO Billno_sequence (name, next_value)
+SELECT 'billno', COALESCE(MAX(billno), 100000) + 1 FROM Courier;
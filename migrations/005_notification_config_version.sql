@@ -0,0 +1,22 @@
+-- 005: versioned notification settings
+-- Each worker cached the SMTP/Twilio settings for its whole lifetime, so a save in the
+-- admin panel only reached the worker that handled it. Every save now bumps `version`;
+-- workers compare it with their cached copy every NOTIFY_CFG_CHECK_INTERVAL seconds
+-- (NotificationSettingsCache in app.py) and reload only when it has moved.
+
+CREATE TABLE IF NOT EXISTS Notification_config (
+  id INT PRIMARY KEY AUTO_INCREMENT,
+  smtp_server VARCHAR(255),
+  smtp_port INT,
+  smtp_username VARCHAR(255),
+  smtp_password TEXT,
+  smtp_use_tls BOOLEAN DEFAULT TRUE,
+  email_from VARCHAR(255),
+  twilio_account_sid VARCHAR(255),
+  twilio_auth_token TEXT,
+  twilio_from_number VARCHAR(50)
+) ENGINE=InnoDB;
+
+ALTER TABLE Notification_config
+  ADD COLUMN version INT NOT NULL DEFAULT 1,
+  ADD COLUMN updated_at DATETIME;
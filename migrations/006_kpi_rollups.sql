@@ -0,0 +1,70 @@
+-- 006: daily KPI rollups for the admin dashboard and /admin/stats
+-- Header cards and statistics used to count or sum the whole Courier, Payments and
+-- Courier_tracking tables on every page view. They now read these per-day rollups.
+--  * Kpi_daily_bookings and Kpi_daily_tracking are backfilled here up to the current
+--    MAX(id), which becomes their Kpi_watermark; the app's kpi-rollup job
+--    (refresh_kpi_rollups in app.py) then folds the rows past the watermark.
+--  * Kpi_daily_payments is kept by the trg_payments_kpi_* triggers in
+--    trigger_procedure.sql, because payments change status in place. It is backfilled
+--    here, so re-run trigger_procedure.sql right after this migration, before payments
+--    are written again.
+
+CREATE TABLE IF NOT EXISTS Kpi_daily_bookings (
+  day DATE NOT NULL,
+  courier_type ENUM('Domestic', 'International') NOT NULL,
+  bookings INT NOT NULL DEFAULT 0,
+  total_weight DECIMAL(14,2) NOT NULL DEFAULT 0,
+  PRIMARY KEY (day, courier_type)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS Kpi_daily_tracking (
+  day DATE NOT NULL,
+  agentid INT NOT NULL,
+  status VARCHAR(50) NOT NULL,
+  events INT NOT NULL DEFAULT 0,
+  PRIMARY KEY (day, agentid, status)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS Kpi_daily_payments (
+  day DATE NOT NULL,
+  payment_status ENUM('Pending', 'Completed', 'Failed') NOT NULL,
+  payments INT NOT NULL DEFAULT 0,
+  amount DECIMAL(14,2) NOT NULL DEFAULT 0,
+  PRIMARY KEY (day, payment_status)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS Kpi_watermark (
+  name VARCHAR(50) NOT NULL,
+  last_id BIGINT NOT NULL DEFAULT 0,
+  safe_max BIGINT NOT NULL DEFAULT 0,
+  updated_at DATETIME,
+  PRIMARY KEY (name)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+SET @bookings_max = (SELECT COALESCE(MAX(cid), 0) FROM Courier);
+SET @tracking_max = (SELECT COALESCE(MAX(trackid), 0) FROM Courier_tracking);
+
+INSERT INTO Kpi_daily_bookings (day, courier_type, bookings, total_weight)
+SELECT date, COALESCE(courier_type, 'Domestic'), COUNT(*), COALESCE(SUM(weight), 0)
+FROM Courier
+WHERE cid <= @bookings_max
+GROUP BY date, COALESCE(courier_type, 'Domestic')
+ON DUPLICATE KEY UPDATE bookings = VALUES(bookings), total_weight = VALUES(total_weight);
+
+INSERT INTO Kpi_daily_tracking (day, agentid, status, events)
+SELECT DATE(t.updated_at), COALESCE(c.agentid, 0), t.status, COUNT(*)
+FROM Courier_tracking t
+JOIN Courier c ON c.cid = t.cid
+WHERE t.trackid <= @tracking_max AND t.updated_at IS NOT NULL
+GROUP BY DATE(t.updated_at), COALESCE(c.agentid, 0), t.status
+ON DUPLICATE KEY UPDATE events = VALUES(events);
+
+INSERT INTO Kpi_watermark (name, last_id, safe_max, updated_at)
+VALUES ('bookings', @bookings_max, @bookings_max, NOW()), ('tracking', @tracking_max, @tracking_max, NOW())
+ON DUPLICATE KEY UPDATE last_id = VALUES(last_id), safe_max = VALUES(safe_max), updated_at = VALUES(updated_at);
+
+INSERT INTO Kpi_daily_payments (day, payment_status, payments, amount)
+SELECT DATE(COALESCE(transaction_date, NOW())), COALESCE(payment_status, 'Pending'), COUNT(*), SUM(amount)
+FROM Payments
+GROUP BY DATE(COALESCE(transaction_date, NOW())), COALESCE(payment_status, 'Pending')
+ON DUPLICATE KEY UPDATE payments = VALUES(payments), amount = VALUES(amount);
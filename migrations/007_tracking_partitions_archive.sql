@@ -0,0 +1,64 @@
+-- 007: monthly partitions and cold archive for Courier_tracking
+-- Courier_tracking is append-only and was never trimmed. It is now partitioned by month
+-- of updated_at, and the history of couriers delivered more than TRACK_ARCHIVE_AFTER_DAYS
+-- days ago is moved into Courier_tracking_archive (one zlib-compressed row per courier)
+-- by `flask archive-tracking` (archive_tracking_history in app.py, run from cron).
+-- `flask tracking-partitions` (add_tracking_partitions, also from cron) adds upcoming
+-- monthly partitions. /track_courier merges both tables.
+--
+-- MySQL partitioning requires every unique key to include the partitioning column and
+-- does not support foreign keys, so the primary key becomes (trackid, updated_at) and the
+-- foreign key to Courier is dropped (the app never deletes couriers; the cid index stays).
+-- Rebuilding the table copies it: run this in a maintenance window.
+
+-- Drop the Courier foreign key under whatever name it was created with
+SET @tracking_fk = (SELECT CONSTRAINT_NAME FROM information_schema.REFERENTIAL_CONSTRAINTS
+                    WHERE CONSTRAINT_SCHEMA = DATABASE() AND TABLE_NAME = 'Courier_tracking'
+                      AND REFERENCED_TABLE_NAME = 'Courier' LIMIT 1);
+SET @drop_fk = IF(@tracking_fk IS NULL, 'DO 0',
+                  CONCAT('ALTER TABLE Courier_tracking DROP FOREIGN KEY `', @tracking_fk, '`'));
+PREPARE drop_fk FROM @drop_fk;
+EXECUTE drop_fk;
+DEALLOCATE PREPARE drop_fk;
+
+UPDATE Courier_tracking SET updated_at = NOW() WHERE updated_at IS NULL;
+
+ALTER TABLE Courier_tracking
+  MODIFY updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  DROP PRIMARY KEY,
+  ADD PRIMARY KEY (trackid, updated_at);
+
+-- Partitions are generated around the month the migration runs: one per month from 12
+-- months back to 3 months ahead. Older rows share p_history, which archiving empties
+-- over time, and `flask tracking-partitions` keeps adding pYYYYMM partitions ahead of the
+-- current month.
+SET @first_month = CAST(CURDATE() - INTERVAL (DAYOFMONTH(CURDATE()) - 1) DAY - INTERVAL 12 MONTH AS DATE);
+SET SESSION group_concat_max_len = 65536;
+WITH RECURSIVE months (n, m) AS (
+  SELECT 0, CAST(@first_month AS DATE)
+  UNION ALL
+  SELECT n + 1, m + INTERVAL 1 MONTH FROM months WHERE n < 15
+)
+SELECT GROUP_CONCAT(CONCAT('PARTITION p', EXTRACT(YEAR_MONTH FROM m),
+                           ' VALUES LESS THAN (''', m + INTERVAL 1 MONTH, ''')')
+                    ORDER BY m SEPARATOR ', ')
+FROM months
+INTO @month_partitions;
+SET @partition_by = CONCAT(
+  'ALTER TABLE Courier_tracking PARTITION BY RANGE COLUMNS (updated_at) (',
+  'PARTITION p_history VALUES LESS THAN (''', @first_month, '''), ',
+  @month_partitions, ', PARTITION p_future VALUES LESS THAN (MAXVALUE))');
+PREPARE partition_by FROM @partition_by;
+EXECUTE partition_by;
+DEALLOCATE PREPARE partition_by;
+
+-- The history blob is already compressed by the app, so the default row format is used.
+CREATE TABLE IF NOT EXISTS Courier_tracking_archive (
+  cid INT NOT NULL,
+  events INT NOT NULL,
+  last_at DATETIME,
+  history MEDIUMBLOB NOT NULL,
+  archived_at DATETIME NOT NULL,
+  PRIMARY KEY (cid),
+  FOREIGN KEY (cid) REFERENCES Courier(cid)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
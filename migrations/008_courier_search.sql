@@ -0,0 +1,20 @@
+-- 008: indexes for the admin shipment search (/admin/api/couriers/search)
+-- Each search branch is served by its own index, keyset-paginated on cid:
+--  * words (names, e-mails, addresses): FULLTEXT, queried in boolean mode as word prefixes
+--  * e-mail and phone prefixes: B-tree indexes on the raw columns
+--  * phone suffixes ("last 4 digits"): indexed virtual columns holding the phone's digits
+--    reversed, so a suffix search becomes a prefix range scan
+-- Adding the first FULLTEXT index rebuilds Courier; run this in a maintenance window.
+
+ALTER TABLE Courier
+  ADD COLUMN sphone_rev VARCHAR(20) AS (REVERSE(REGEXP_REPLACE(sphone, '[^0-9]', ''))) VIRTUAL,
+  ADD COLUMN rphone_rev VARCHAR(20) AS (REVERSE(REGEXP_REPLACE(rphone, '[^0-9]', ''))) VIRTUAL;
+
+CREATE INDEX ix_courier_sphone_rev ON Courier (sphone_rev);
+CREATE INDEX ix_courier_rphone_rev ON Courier (rphone_rev);
+CREATE INDEX ix_courier_sphone ON Courier (sphone);
+CREATE INDEX ix_courier_rphone ON Courier (rphone);
+CREATE INDEX ix_courier_semail ON Courier (semail);
+CREATE INDEX ix_courier_remail ON Courier (remail);
+
+CREATE FULLTEXT INDEX ft_courier_search ON Courier (sname, rname, semail, remail, saddress, raddress);
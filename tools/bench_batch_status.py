@@ -0,0 +1,166 @@
+"""
+Benchmark: one batch status update against N separate /update_status requests.
+
+Usage (from project root, against a scratch database with migrations applied):
+
+    python tools/bench_batch_status.py --couriers 500
+    python tools/bench_batch_status.py --couriers 1000 --status Pending --json batch.json
+
+    # quick local run without MySQL
+    DATABASE_URL=sqlite:////tmp/batch.db python tools/bench_batch_status.py --create-tables
+
+This script will:
+ - create a user, a delivery agent and 2 x --couriers assigned couriers with multi-row
+   inserts (one set for each method, so both start from the same state)
+ - set --status on the first set with one POST /update_status/<id> per courier, as an
+   admin clicking through the dashboard would
+ - set it on the second set with a single POST /admin/couriers/status
+ - print (and with --json, write) wall time, time per courier, SQL statements and the
+   speed-up of the batch update
+
+Notifications are queued in the outbox but not sent (the dispatcher is not started). The
+couriers are created with bill numbers from the app's allocator and left in place; use a
+scratch database.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+# Ensure project root (one level up from tools/) is on sys.path so we can import app
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+# Leave the outbox alone: a benchmark must not send email/SMS
+os.environ.setdefault('NOTIFY_DISPATCHER', 'external')
+
+from sqlalchemy import event
+
+try:
+    from app import app, db, Admin, User, DeliveryAgent, Courier, CourierTracking, billno_allocator, ist_now
+except Exception as e:
+    print('Error importing app from project root:', e)
+    print('Make sure you run this script from the project root or use the provided instructions.')
+    raise
+
+
+def create_couriers(n, tag):
+    """Insert n assigned couriers (with their first tracking row); return their cids."""
+    if not Admin.query.first():
+        db.session.execute(Admin.__table__.insert(), [{'email': f'batch{tag}-admin@example.com', 'name': 'Bench'}])
+    db.session.execute(User.__table__.insert(), [{'email': f'batch{tag}@example.com', 'name': 'Bench'}])
+    uid = db.session.execute(db.select(User.uid).where(User.email == f'batch{tag}@example.com')).scalar()
+    db.session.execute(DeliveryAgent.__table__.insert(), [
+        {'name': 'Bench Agent', 'email': f'batch{tag}-agent@example.com', 'assigned_area': 'Chennai'}])
+    agentid = db.session.execute(
+        db.select(DeliveryAgent.agentid).where(DeliveryAgent.email == f'batch{tag}-agent@example.com')).scalar()
+    # The allocator reserves bill numbers in its own transaction
+    db.session.commit()
+
+    now = ist_now()
+    billnos = billno_allocator.allocate(n)
+    db.session.execute(Courier.__table__.insert(), [{
+        'uid': uid, 'semail': 'sender@example.com', 'remail': 'receiver@example.com',
+        'sname': 'Sender', 'rname': 'Receiver', 'sphone': '9000000000', 'rphone': '9000000001',
+        'saddress': '12 Main Road, Mumbai', 'raddress': '34 Park Street, Chennai', 'weight': 2,
+        'billno': billno, 'courier_type': 'Domestic', 'country': 'India', 'date': now.date(),
+        'agentid': agentid, 'current_status': 'Out for Delivery', 'current_location': 'Chennai',
+        'status_updated_at': now,
+    } for billno in billnos])
+    cids = db.session.execute(db.select(Courier.cid).where(Courier.billno.in_(billnos))
+                              .order_by(Courier.cid)).scalars().all()
+    db.session.execute(CourierTracking.__table__.insert(), [
+        {'cid': cid, 'status': 'Out for Delivery', 'current_location': 'Chennai', 'updated_at': now}
+        for cid in cids])
+    db.session.commit()
+    admin_id = db.session.execute(db.select(Admin.aid).order_by(Admin.aid).limit(1)).scalar()
+    return cids, admin_id
+
+
+def timed(requests_, admin_id):
+    """Send (url, form) requests as an admin; return (wall seconds, statements, failures)."""
+    statements = 0
+
+    def count_statement(*_):
+        nonlocal statements
+        statements += 1
+
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['user_id'] = admin_id
+        sess['user_email'] = 'bench@example.com'
+        sess['user_role'] = 'Admin'
+    with app.app_context():
+        engine = db.engine
+    failures = 0
+    event.listen(engine, 'before_cursor_execute', count_statement)
+    started = time.perf_counter()
+    try:
+        for url, form in requests_:
+            resp = client.post(url, data=form)
+            failures += resp.status_code >= 400
+    finally:
+        event.remove(engine, 'before_cursor_execute', count_statement)
+    return time.perf_counter() - started, statements, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark batch status updates.')
+    parser.add_argument('--couriers', type=int, default=200, help='couriers updated by each method')
+    parser.add_argument('--status', default='In Transit',
+                        choices=('Pending', 'Out for Delivery', 'In Transit', 'Cancelled'))
+    parser.add_argument('--location', default='Chennai Hub')
+    parser.add_argument('--json', help='also write the report to this file')
+    parser.add_argument('--create-tables', action='store_true',
+                        help='create missing tables first (for a scratch DATABASE_URL)')
+    args = parser.parse_args()
+
+    if args.couriers > app.config['BATCH_STATUS_MAX']:
+        parser.error(f"--couriers is above BATCH_STATUS_MAX ({app.config['BATCH_STATUS_MAX']})")
+
+    with app.app_context():
+        if args.create_tables:
+            db.create_all()
+        database = db.engine.dialect.name
+        cids, admin_id = create_couriers(2 * args.couriers, int(time.time()))
+    single_cids, batch_cids = cids[:args.couriers], cids[args.couriers:]
+
+    form = {'status': args.status, 'current_location': args.location}
+    single = timed([(f'/update_status/{cid}', form) for cid in single_cids], admin_id)
+    batch = timed([('/admin/couriers/status', dict(form, courier_ids=[str(cid) for cid in batch_cids]))], admin_id)
+
+    with app.app_context():
+        applied = db.session.execute(
+            db.select(db.func.count()).select_from(Courier)
+            .where(Courier.cid.in_(cids), Courier.current_status == args.status)).scalar()
+
+    def summary(result, requests_):
+        wall, statements, failures = result
+        return {
+            'requests': requests_,
+            'failed_requests': failures,
+            'wall_s': round(wall, 3),
+            'ms_per_courier': round(wall * 1000 / args.couriers, 2),
+            'sql_statements': statements,
+        }
+
+    report = {
+        'couriers': args.couriers,
+        'status': args.status,
+        'database': database,
+        'single_updates': summary(single, args.couriers),
+        'batch_update': summary(batch, 1),
+        'speedup': round(single[0] / batch[0], 1) if batch[0] else None,
+        'couriers_with_new_status': f'{applied}/{len(cids)}',
+    }
+    print(json.dumps(report, indent=2))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as fh:
+            json.dump(report, fh, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""
+Benchmark: logins per second (and per core) through the /login route.
+
+Usage (from project root):
+
+    python tools/bench_login.py --logins 400 --concurrency 8
+    python tools/bench_login.py --methods pbkdf2:sha256:600000,pbkdf2:sha256:260000,scrypt
+
+    # quick local run without MySQL
+    DATABASE_URL=sqlite:////tmp/login.db python tools/bench_login.py --create-tables
+
+This script will:
+ - for each hash method in --methods, time check_password_hash on one thread to show
+   the raw cost of a verification
+ - create --users user accounts whose passwords are hashed with PASSWORD_HASH_METHOD
+ - post --logins logins to /login through the Flask test client from --concurrency
+   threads (each login is one joined Credentials query plus one verification on the
+   bounded hashing pool)
+ - print a JSON summary with logins/second, logins/second per core and latency
+
+The accounts are created with e-mail addresses unique to the run and left in place; use
+a scratch database.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+# Ensure project root (one level up from tools/) is on sys.path so we can import app
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+os.environ.setdefault('NOTIFY_DISPATCHER', 'external')
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+try:
+    from app import app, db, User, Credentials
+except Exception as e:
+    print('Error importing app from project root:', e)
+    print('Make sure you run this script from the project root or use the provided instructions.')
+    raise
+
+PASSWORD = 'bench-password'
+
+
+def verifications_per_sec(method, seconds=1.0):
+    stored = generate_password_hash(PASSWORD, method)
+    count, started = 0, time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        check_password_hash(stored, PASSWORD)
+        count += 1
+    return round(count / (time.perf_counter() - started), 1)
+
+
+def create_accounts(n, tag):
+    stored = generate_password_hash(PASSWORD, app.config['PASSWORD_HASH_METHOD'])
+    emails = [f'login{tag}-{i}@example.com' for i in range(n)]
+    db.session.execute(User.__table__.insert(), [{'email': e, 'name': 'Bench'} for e in emails])
+    uids = dict(db.session.execute(db.select(User.email, User.uid).where(User.email.in_(emails))).all())
+    db.session.execute(Credentials.__table__.insert(), [
+        {'email': e, 'password': stored, 'role': 'User', 'uid': uids[e]} for e in emails])
+    db.session.commit()
+    return emails
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark /login throughput.')
+    parser.add_argument('--logins', type=int, default=200)
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--concurrency', type=int, default=os.cpu_count() or 4)
+    parser.add_argument('--methods', default=None,
+                        help='comma-separated hash methods to time (default: PASSWORD_HASH_METHOD)')
+    parser.add_argument('--create-tables', action='store_true',
+                        help='create missing tables first (for a scratch DATABASE_URL)')
+    args = parser.parse_args()
+
+    methods = [m.strip() for m in (args.methods or app.config['PASSWORD_HASH_METHOD']).split(',') if m.strip()]
+    raw = {m: verifications_per_sec(m) for m in methods}
+
+    with app.app_context():
+        if args.create_tables:
+            db.create_all()
+        emails = create_accounts(args.users, int(time.time()))
+
+    latencies, failures = [], 0
+    lock = threading.Lock()
+
+    def worker(indexes):
+        nonlocal failures
+        for i in indexes:
+            client = app.test_client()
+            started = time.perf_counter()
+            resp = client.post('/login', data={'email': emails[i % len(emails)], 'password': PASSWORD})
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+                failures += resp.status_code != 302
+
+    threads = [threading.Thread(target=worker, args=(range(t, args.logins, args.concurrency),))
+               for t in range(args.concurrency)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    cores = os.cpu_count() or 1
+    rate = len(latencies) / wall
+    print(json.dumps({
+        'hash_method': app.config['PASSWORD_HASH_METHOD'],
+        'hash_workers': app.config['PASSWORD_HASH_WORKERS'],
+        'verifications_per_sec_one_thread': raw,
+        'logins': len(latencies),
+        'failed_logins': failures,
+        'concurrency': args.concurrency,
+        'cores': cores,
+        'logins_per_sec': round(rate, 1),
+        'logins_per_sec_per_core': round(rate / min(cores, app.config['PASSWORD_HASH_WORKERS']), 1),
+        'p50_ms': round(latencies[len(latencies) // 2] * 1000, 1),
+        'p95_ms': round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 1),
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
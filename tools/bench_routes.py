@@ -0,0 +1,379 @@
+"""
+Benchmark the main Flask routes against a seeded database and report latency as JSON.
+
+Usage (from project root, against a scratch database with migrations applied):
+
+    python tools/bench_routes.py --couriers 10000 --json bench.json
+    python tools/bench_routes.py --reuse --requests 500 --baseline bench.json
+
+    # quick local run without MySQL (stored-procedure routes will report errors)
+    DATABASE_URL=sqlite:////tmp/bench.db python tools/bench_routes.py --create-tables --couriers 2000
+
+This script will:
+ - seed the database with --couriers couriers (each with up to --tracking-per-courier
+   tracking rows and a payment), plus users, delivery agents and pricing bands, using
+   multi-row inserts; --reuse skips seeding and benchmarks the data already there
+ - drive /track_courier, /dashboard, /admin_dashboard, /create_courier, /payment/<id>,
+   /assign_courier/<id> and /update_status/<id> through the Flask test client, from
+   --concurrency threads, --requests times each
+ - print (and with --json, write) p50/p95/p99 latency, throughput, queries per request
+   and error counts per route
+ - with --baseline, compare p95 latency against an earlier report and exit 1 if any route
+   got slower than --max-regression times its baseline
+
+Notifications are queued in the outbox but not sent (the dispatcher is not started), so
+runs are repeatable. Write routes consume data: each payment and assignment request
+uses a different courier, so seed at least --requests pending/unassigned couriers.
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from datetime import timedelta
+
+# Ensure project root (one level up from tools/) is on sys.path so we can import app
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+# Leave the outbox alone: a benchmark must not send email/SMS
+os.environ.setdefault('NOTIFY_DISPATCHER', 'external')
+
+from flask.logging import default_handler
+from sqlalchemy import event
+
+try:
+    from app import (app, db, Admin, User, DeliveryAgent, Courier, CourierTracking, Payment,
+                     CourierPricing, billno_allocator, ist_now)
+except Exception as e:
+    print('Error importing app from project root:', e)
+    print('Make sure you run this script from the project root or use the provided instructions.')
+    raise
+
+from seed_data import CITIES, pricing_rows, tracking_path
+
+ROUTES = ('track_courier', 'dashboard', 'admin_dashboard', 'create_courier', 'payment',
+          'assign_courier', 'update_status')
+STATUS_WEIGHTS = {'Pending': 20, 'Payment Received': 20, 'Out for Delivery': 25, 'In Transit': 15,
+                  'Delivered': 18, 'Cancelled': 2}
+CHUNK = 5000
+
+
+def insert_chunked(table, rows):
+    for i in range(0, len(rows), CHUNK):
+        db.session.execute(table.insert(), rows[i:i + CHUNK])
+
+
+def seed(n_couriers, per_courier, rng):
+    """Insert a synthetic dataset and return a short summary."""
+    tag = f'{int(time.time())}{rng.randrange(1000):03d}'
+    if not CourierPricing.query.first():
+        insert_chunked(CourierPricing.__table__, pricing_rows())
+    prices = {p.courier_type: p.priceid for p in CourierPricing.query.all()}
+    if not Admin.query.first():
+        insert_chunked(Admin.__table__, [{'email': f'bench-admin-{tag}@example.com', 'name': 'Bench Admin'}])
+
+    n_users = max(1, n_couriers // 20)
+    insert_chunked(User.__table__, [{'email': f'b{tag}-u{i}@example.com', 'name': f'User {i}',
+                                     'phoneno': f'9{i:09d}'[:10]} for i in range(n_users)])
+    uids = [uid for (uid,) in db.session.execute(
+        db.select(User.uid).where(User.email.like(f'b{tag}-u%')))]
+    insert_chunked(DeliveryAgent.__table__, [{'name': f'Agent {i}', 'email': f'b{tag}-a{i}@example.com',
+                                              'phone': f'8{i:09d}'[:10], 'assigned_area': CITIES[i % len(CITIES)]}
+                                             for i in range(50)])
+    agentids = [a for (a,) in db.session.execute(
+        db.select(DeliveryAgent.agentid).where(DeliveryAgent.email.like(f'b{tag}-a%')))]
+    db.session.commit()
+
+    statuses, weights = zip(*STATUS_WEIGHTS.items())
+    today = ist_now().replace(tzinfo=None)
+    for start in range(0, n_couriers, CHUNK):
+        count = min(CHUNK, n_couriers - start)
+        billnos = billno_allocator.allocate(count)
+        couriers = []
+        for billno in billnos:
+            status = rng.choices(statuses, weights)[0]
+            ctype = 'International' if rng.random() < 0.1 else 'Domestic'
+            src, dst = rng.sample(CITIES, 2)
+            booked = today - timedelta(days=rng.randrange(365), minutes=rng.randrange(1440))
+            path = tracking_path(status, per_courier)
+            couriers.append({
+                'uid': rng.choice(uids), 'semail': 'sender@example.com', 'remail': 'receiver@example.com',
+                'sname': 'Sender', 'rname': 'Receiver', 'sphone': '9000000000', 'rphone': '9000000001',
+                'saddress': f'12 Main Road, {src}', 'raddress': f'34 Park Street, {dst}',
+                'weight': round(rng.uniform(0.2, 20 if ctype == 'Domestic' else 45), 2), 'billno': billno,
+                'courier_type': ctype, 'country': 'India' if ctype == 'Domestic' else 'UAE',
+                'date': booked.date(), 'priceid': prices.get(ctype),
+                'agentid': rng.choice(agentids) if path[-1] in ('Out for Delivery', 'In Transit', 'Delivered') else None,
+                'current_status': path[-1], 'current_location': dst if len(path) > 1 else src,
+                'status_updated_at': booked + timedelta(hours=6 * (len(path) - 1)),
+                '_path': path, '_booked': booked, '_src': src, '_dst': dst,
+            })
+        db.session.execute(Courier.__table__.insert(), [
+            {k: v for k, v in c.items() if not k.startswith('_')} for c in couriers])
+        cids = dict(db.session.execute(db.select(Courier.billno, Courier.cid).where(Courier.billno.in_(billnos))).all())
+        tracking, payments = [], []
+        for c in couriers:
+            cid = cids[c['billno']]
+            for step, status in enumerate(c['_path']):
+                tracking.append({'cid': cid, 'status': status, 'updated_at': c['_booked'] + timedelta(hours=6 * step),
+                                 'current_location': c['_src'] if step == 0 else c['_dst']})
+            paid = c['current_status'] not in ('Pending', 'Cancelled')
+            payments.append({'cid': cid, 'uid': c['uid'], 'amount': 120, 'payment_mode': 'UPI' if paid else None,
+                             'payment_status': 'Pending', 'transaction_date': c['_booked']})
+        insert_chunked(CourierTracking.__table__, tracking)
+        # Completed with an UPDATE so trg_payments_after_insert leaves the seeded history alone
+        insert_chunked(Payment.__table__, payments)
+        paid_cids = [p['cid'] for p, c in zip(payments, couriers) if c['current_status'] not in ('Pending', 'Cancelled')]
+        if paid_cids:
+            db.session.execute(Payment.__table__.update().where(Payment.__table__.c.cid.in_(paid_cids))
+                               .values(payment_status='Completed'))
+        db.session.commit()
+        print(f'  seeded {start + count}/{n_couriers} couriers', file=sys.stderr)
+    return {'couriers': n_couriers, 'users': n_users, 'agents': len(agentids), 'tag': tag}
+
+
+def login(client, role, user_id, email='bench@example.com'):
+    with client.session_transaction() as sess:
+        sess['user_id'] = user_id
+        sess['user_email'] = email
+        sess['user_role'] = role
+
+
+def build_plan(n_requests, rng):
+    """Return {route: [(role, principal_id, method, url, form)]} sampled from the database."""
+    admin_id = db.session.execute(db.select(Admin.aid).limit(1)).scalar()
+    sample = db.session.execute(
+        db.select(Courier.cid, Courier.billno, Courier.uid).order_by(Courier.cid.desc()).limit(max(n_requests * 5, 1000))
+    ).all()
+    pending_payments = db.session.execute(
+        db.select(Payment.cid, Payment.uid).where(Payment.payment_status == 'Pending')
+        .order_by(Payment.pid.desc()).limit(n_requests)).all()
+    unassigned = [cid for (cid,) in db.session.execute(
+        db.select(Courier.cid).where(Courier.agentid.is_(None), Courier.current_status.notin_(('Delivered', 'Cancelled')))
+        .order_by(Courier.cid.desc()).limit(n_requests))]
+    agentids = [a for (a,) in db.session.execute(db.select(DeliveryAgent.agentid))]
+    if not admin_id or not sample or not agentids:
+        raise SystemExit('Nothing to benchmark: seed the database first (drop --reuse).')
+
+    def pick():
+        return rng.choice(sample)
+
+    form = {'semail': 'sender@example.com', 'remail': 'receiver@example.com', 'sname': 'Sender',
+            'rname': 'Receiver', 'sphone': '9000000000', 'rphone': '9000000001',
+            'saddress': '12 Main Road, Mumbai', 'raddress': '34 Park Street, Chennai',
+            'courier_type': 'Domestic', 'country': 'India'}
+    plan = {
+        'track_courier': [(None, None, 'GET', f'/track_courier?tracking_number={pick().billno}', None)
+                          for _ in range(n_requests)],
+        'dashboard': [('User', pick().uid, 'GET', '/dashboard', None) for _ in range(n_requests)],
+        'admin_dashboard': [('Admin', admin_id, 'GET', '/admin_dashboard', None) for _ in range(n_requests)],
+        'create_courier': [('User', pick().uid, 'POST', '/create_courier',
+                            dict(form, weight=str(round(rng.uniform(0.5, 20), 2)))) for _ in range(n_requests)],
+        'payment': [('User', uid, 'POST', f'/payment/{cid}', {'payment_mode': 'Net Banking'})
+                    for cid, uid in pending_payments],
+        'assign_courier': [('Admin', admin_id, 'POST', f'/assign_courier/{cid}', {'agent_id': str(rng.choice(agentids))})
+                           for cid in unassigned],
+        'update_status': [('Admin', admin_id, 'POST', f'/update_status/{pick().cid}',
+                           {'status': 'In Transit', 'current_location': 'Bench Hub'}) for _ in range(n_requests)],
+    }
+    return plan
+
+
+class _ErrorCounter(logging.Handler):
+    """Count ERROR log records; the routes log and flash errors instead of returning 500."""
+
+    def __init__(self):
+        super().__init__(logging.ERROR)
+        self.count = 0
+        self.first = None
+
+    def emit(self, record):
+        self.count += 1
+        if self.first is None:
+            self.first = record.getMessage().splitlines()[0][:300]
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def run_route(requests_, concurrency):
+    """Send the requests from `concurrency` threads; return (latencies, queries, failures, wall seconds)."""
+    local = threading.local()
+    latencies, queries = [], []
+    failures = 0
+    lock = threading.Lock()
+
+    def count_statement(*_):
+        if getattr(local, 'counting', False):
+            local.statements += 1
+
+    def worker(chunk):
+        nonlocal failures
+        client = app.test_client()
+        logged_in = None
+        for role, principal, method, url, form in chunk:
+            if role and (role, principal) != logged_in:
+                login(client, role, principal)
+                logged_in = (role, principal)
+            local.statements = 0
+            local.counting = True
+            started = time.perf_counter()
+            resp = client.open(url, method=method, data=form)
+            elapsed = time.perf_counter() - started
+            local.counting = False
+            with lock:
+                latencies.append(elapsed)
+                queries.append(local.statements)
+                failures += resp.status_code >= 400
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', count_statement)
+    threads = [threading.Thread(target=worker, args=(requests_[i::concurrency],)) for i in range(concurrency)]
+    started = time.perf_counter()
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        event.remove(engine, 'before_cursor_execute', count_statement)
+    return latencies, queries, failures, time.perf_counter() - started
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the main Flask routes.')
+    parser.add_argument('--couriers', type=int, default=10000, help='couriers to seed (default: 10000)')
+    parser.add_argument('--tracking-per-courier', type=int, default=4)
+    parser.add_argument('--reuse', action='store_true', help='do not seed; benchmark the existing data')
+    parser.add_argument('--create-tables', action='store_true',
+                        help='create missing tables first (for a scratch DATABASE_URL)')
+    parser.add_argument('--requests', type=int, default=200, help='requests per route (default: 200)')
+    parser.add_argument('--concurrency', type=int, default=4, help='client threads (default: 4)')
+    parser.add_argument('--routes', default=','.join(ROUTES), help='comma-separated subset of: ' + ', '.join(ROUTES))
+    parser.add_argument('--no-track-cache', action='store_true', help='disable the /track_courier cache')
+    parser.add_argument('--seed', type=int, default=42, help='random seed')
+    parser.add_argument('--verbose', action='store_true', help='keep the app log (tracebacks) on stderr')
+    parser.add_argument('--json', help='write the report to this file')
+    parser.add_argument('--baseline', help='earlier JSON report to compare p95 latency against')
+    parser.add_argument('--max-regression', type=float, default=1.25,
+                        help='fail if a route p95 exceeds baseline p95 times this (default: 1.25)')
+    args = parser.parse_args()
+
+    routes = [r.strip() for r in args.routes.split(',') if r.strip()]
+    unknown = set(routes) - set(ROUTES)
+    if unknown:
+        parser.error('unknown route(s): ' + ', '.join(sorted(unknown)))
+    rng = random.Random(args.seed)
+    if args.no_track_cache:
+        app.config['TRACK_CACHE_TTL'] = 0
+
+    with app.app_context():
+        if args.create_tables:
+            db.create_all()
+        seeded = None
+        if not args.reuse:
+            started = time.perf_counter()
+            seeded = seed(args.couriers, args.tracking_per_courier, rng)
+            seeded['seconds'] = round(time.perf_counter() - started, 1)
+        plan = build_plan(args.requests, rng)
+        totals = {'couriers': db.session.query(Courier).count(),
+                  'tracking_rows': db.session.query(CourierTracking).count()}
+        backend = db.engine.url.get_backend_name()
+        db.session.remove()
+
+    errors = _ErrorCounter()
+    app.logger.addHandler(errors)
+    if not args.verbose:
+        app.logger.removeHandler(default_handler)
+    results = {}
+    for route in routes:
+        requests_ = plan[route]
+        if not requests_:
+            results[route] = {'requests': 0, 'skipped': 'no suitable couriers in the database'}
+            continue
+        # One untimed request per route warms caches and imports
+        run_route(requests_[:1], 1)
+        errors.count, errors.first = 0, None
+        latencies, queries, failures, wall = run_route(requests_[1:] or requests_, args.concurrency)
+        latencies.sort()
+        ms = lambda v: round(v * 1000, 2) if v is not None else None
+        results[route] = {
+            'requests': len(latencies),
+            'errors': failures + errors.count,
+            'p50_ms': ms(percentile(latencies, 50)),
+            'p95_ms': ms(percentile(latencies, 95)),
+            'p99_ms': ms(percentile(latencies, 99)),
+            'mean_ms': ms(sum(latencies) / len(latencies)),
+            'max_ms': ms(latencies[-1]),
+            'throughput_rps': round(len(latencies) / wall, 1),
+            'queries_per_request': round(sum(queries) / len(queries), 2),
+            'max_queries': max(queries),
+        }
+        if errors.first:
+            results[route]['first_error'] = errors.first
+        print(f"{route:16} p50={results[route]['p50_ms']}ms p95={results[route]['p95_ms']}ms "
+              f"p99={results[route]['p99_ms']}ms {results[route]['throughput_rps']} req/s "
+              f"{results[route]['queries_per_request']} queries/req errors={results[route]['errors']}",
+              file=sys.stderr)
+    app.logger.removeHandler(errors)
+
+    report = {
+        'meta': {
+            'revision': git_revision(),
+            'database': backend,
+            'dataset': totals,
+            'seeded': seeded,
+            'requests_per_route': args.requests,
+            'concurrency': args.concurrency,
+            'track_cache': not args.no_track_cache,
+            'ran_at': ist_now().strftime('%Y-%m-%d %H:%M:%S'),
+        },
+        'routes': results,
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as fh:
+            baseline = json.load(fh).get('routes', {})
+        comparison = {}
+        for route, current in results.items():
+            before = baseline.get(route, {}).get('p95_ms')
+            if before and current.get('p95_ms'):
+                ratio = round(current['p95_ms'] / before, 2)
+                comparison[route] = {'baseline_p95_ms': before, 'p95_ms': current['p95_ms'], 'ratio': ratio}
+                if ratio > args.max_regression:
+                    regressions.append(route)
+        report['comparison'] = comparison
+
+    output = json.dumps(report, indent=2, default=str)
+    print(output)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as fh:
+            fh.write(output + '\n')
+    if regressions:
+        print('p95 regression beyond threshold: ' + ', '.join(regressions), file=sys.stderr)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+"""
+Benchmark: messages per second through send_email's SMTP path, before and after pooling.
+
+Usage (from project root):
+
+    python tools/bench_smtp.py --messages 500 --handshake-ms 20
+
+This script will:
+ - start a local SMTP stand-in on 127.0.0.1 (aiosmtpd if it is installed, otherwise a
+   small built-in sink that speaks just enough SMTP for smtplib)
+ - send --messages emails the old way (new connection + login per message)
+ - send the same messages through app.smtp_pool over one pooled session
+ - print a JSON summary with messages/second for both
+
+--handshake-ms adds an artificial delay to every new connection greeting to stand in for
+the TCP + STARTTLS + AUTH cost of a real relay (the local stand-in has no TLS).
+"""
+
+import argparse
+import json
+import os
+import socketserver
+import smtplib
+import sys
+import threading
+import time
+
+# Ensure project root (one level up from tools/) is on sys.path so we can import app
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from app import SMTPConnectionPool, build_email
+
+
+class _SinkHandler(socketserver.StreamRequestHandler):
+    """Accept-everything SMTP server: EHLO/HELO, AUTH, MAIL, RCPT, DATA, RSET, NOOP, QUIT."""
+
+    handshake_delay = 0.0
+
+    def _reply(self, line):
+        self.wfile.write(line.encode() + b'\r\n')
+
+    def handle(self):
+        if self.handshake_delay:
+            time.sleep(self.handshake_delay)
+        self._reply('220 localhost bench SMTP sink')
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            cmd = line.decode(errors='replace').strip().upper()
+            if cmd.startswith('EHLO'):
+                self.wfile.write(b'250-localhost\r\n250-AUTH PLAIN LOGIN\r\n250 8BITMIME\r\n')
+            elif cmd.startswith('HELO'):
+                self._reply('250 localhost')
+            elif cmd.startswith('AUTH'):
+                self._reply('235 Authentication successful')
+            elif cmd.startswith('DATA'):
+                self._reply('354 End data with <CR><LF>.<CR><LF>')
+                while self.rfile.readline() not in (b'.\r\n', b''):
+                    pass
+                self._reply('250 OK queued')
+            elif cmd.startswith('QUIT'):
+                self._reply('221 Bye')
+                return
+            else:
+                self._reply('250 OK')
+
+
+class _ThreadedSink(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def start_sink(handshake_ms):
+    """Start an SMTP stand-in and return (port, stop)."""
+    try:
+        from aiosmtpd.controller import Controller
+    except ImportError:
+        Controller = None
+
+    if Controller is not None and not handshake_ms:
+        class _Handler:
+            async def handle_DATA(self, server, session, envelope):
+                return '250 OK queued'
+        controller = Controller(_Handler(), hostname='127.0.0.1', port=0)
+        controller.start()
+        return controller.server.sockets[0].getsockname()[1], controller.stop
+
+    _SinkHandler.handshake_delay = handshake_ms / 1000.0
+    server = _ThreadedSink(('127.0.0.1', 0), _SinkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server.server_address[1], server.shutdown
+
+
+def send_unpooled(cfg, messages):
+    """The pre-pool behaviour: one connection, STARTTLS and LOGIN per message."""
+    for msg in messages:
+        with smtplib.SMTP(cfg['SMTP_SERVER'], cfg['SMTP_PORT'], timeout=10) as s:
+            if cfg.get('SMTP_USE_TLS'):
+                s.starttls()
+            if cfg.get('SMTP_USERNAME') and cfg.get('SMTP_PASSWORD'):
+                s.login(cfg['SMTP_USERNAME'], cfg['SMTP_PASSWORD'])
+            s.send_message(msg)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--messages', type=int, default=500)
+    parser.add_argument('--handshake-ms', type=float, default=20.0,
+                        help='artificial per-connection setup delay (default: 20)')
+    args = parser.parse_args()
+
+    port, stop = start_sink(args.handshake_ms)
+    cfg = {'SMTP_SERVER': '127.0.0.1', 'SMTP_PORT': port, 'SMTP_USERNAME': 'bench',
+           'SMTP_PASSWORD': 'bench', 'SMTP_USE_TLS': False, 'EMAIL_FROM': 'bench@localhost'}
+    messages = [build_email(cfg, f'user{i}@example.com', f'Courier Update: {i}', 'Status: In Transit')
+                for i in range(args.messages)]
+
+    try:
+        started = time.perf_counter()
+        send_unpooled(cfg, messages)
+        unpooled = time.perf_counter() - started
+
+        pool = SMTPConnectionPool(max_size=1)
+        started = time.perf_counter()
+        results = pool.send_messages(cfg, messages)
+        pooled = time.perf_counter() - started
+        pool.close_all()
+    finally:
+        stop()
+
+    print(json.dumps({
+        'messages': args.messages,
+        'handshake_ms': args.handshake_ms,
+        'unpooled_msgs_per_sec': round(args.messages / unpooled, 1),
+        'pooled_msgs_per_sec': round(args.messages / pooled, 1),
+        'pooled_failures': results.count(False),
+        'speedup': round(unpooled / pooled, 2),
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+"""
+Check that the dashboards issue a fixed number of SQL statements, however many couriers
+they show.
+
+Usage (from project root, against a scratch database with migrations applied):
+
+    python tools/check_query_counts.py
+    python tools/check_query_counts.py --small 50 --large 1000
+
+    # quick local run without MySQL
+    DATABASE_URL=sqlite:////tmp/queries.db python tools/check_query_counts.py --create-tables
+
+This script will:
+ - create a user and a delivery agent that own --small couriers (each with tracking rows
+   and a payment), with multi-row inserts
+ - request /admin_dashboard, /dashboard and /agent_dashboard as the matching role and
+   count the statements each request sends (SQLAlchemy before_cursor_execute)
+ - add couriers until the same user and agent own --large of them and count again
+ - print the counts as JSON and exit 1 if a count grew with the data (a per-row lazy
+   load) or a page did not render
+
+The rows are left in place; use a scratch database.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import timedelta
+
+# Ensure project root (one level up from tools/) is on sys.path so we can import app
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+# Leave the outbox alone: a check must not send email/SMS
+os.environ.setdefault('NOTIFY_DISPATCHER', 'external')
+
+from sqlalchemy import event
+
+try:
+    from app import (app, db, Admin, User, DeliveryAgent, Courier, CourierTracking, Payment,
+                     billno_allocator, ist_now)
+except Exception as e:
+    print('Error importing app from project root:', e)
+    print('Make sure you run this script from the project root or use the provided instructions.')
+    raise
+
+from seed_data import CITIES, STATUS_PATH, tracking_path
+
+TRACKING_PER_COURIER = 4
+
+
+def create_owners(tag):
+    """Insert a user and a delivery agent (and an admin if there is none); return their ids."""
+    if not Admin.query.first():
+        db.session.execute(Admin.__table__.insert(), [{'email': f'queries{tag}-admin@example.com', 'name': 'Check'}])
+    db.session.execute(User.__table__.insert(), [{'email': f'queries{tag}@example.com', 'name': 'Check'}])
+    db.session.execute(DeliveryAgent.__table__.insert(), [
+        {'name': 'Check Agent', 'email': f'queries{tag}-agent@example.com', 'assigned_area': CITIES[0]}])
+    ids = {
+        'Admin': db.session.execute(db.select(Admin.aid).order_by(Admin.aid).limit(1)).scalar(),
+        'User': db.session.execute(db.select(User.uid).where(User.email == f'queries{tag}@example.com')).scalar(),
+        'Agent': db.session.execute(
+            db.select(DeliveryAgent.agentid).where(DeliveryAgent.email == f'queries{tag}-agent@example.com')).scalar(),
+    }
+    db.session.commit()
+    return ids
+
+
+def add_couriers(n, uid, agentid):
+    """Insert n couriers for uid, assigned to agentid, with their tracking rows and payments."""
+    if n <= 0:
+        return
+    now = ist_now().replace(tzinfo=None)
+    # The allocator reserves bill numbers in its own transaction
+    billnos = billno_allocator.allocate(n)
+    paths = {billno: tracking_path(STATUS_PATH[2 + i % 3], TRACKING_PER_COURIER) for i, billno in enumerate(billnos)}
+    db.session.execute(Courier.__table__.insert(), [{
+        'uid': uid, 'semail': 'sender@example.com', 'remail': 'receiver@example.com',
+        'sname': 'Sender', 'rname': 'Receiver', 'sphone': '9000000000', 'rphone': '9000000001',
+        'saddress': f'12 Main Road, {CITIES[1]}', 'raddress': f'34 Park Street, {CITIES[0]}', 'weight': 2,
+        'billno': billno, 'courier_type': 'Domestic', 'country': 'India', 'date': now.date(),
+        'agentid': agentid, 'current_status': path[-1], 'current_location': CITIES[0],
+        'status_updated_at': now,
+    } for billno, path in paths.items()])
+    cids = dict(db.session.execute(db.select(Courier.billno, Courier.cid).where(Courier.billno.in_(billnos))).all())
+    db.session.execute(CourierTracking.__table__.insert(), [
+        {'cid': cids[billno], 'status': status, 'current_location': CITIES[0],
+         'updated_at': now - timedelta(hours=len(path) - step)}
+        for billno, path in paths.items() for step, status in enumerate(path)])
+    db.session.execute(Payment.__table__.insert(), [
+        {'cid': cids[billno], 'uid': uid, 'amount': 120, 'payment_mode': 'UPI', 'payment_status': 'Completed',
+         'transaction_date': now} for billno in billnos])
+    db.session.commit()
+
+
+def count_statements(ids):
+    """Request each dashboard once untimed and once counted; return {route: (statements, status)}."""
+    statements = 0
+
+    def count_statement(*_):
+        nonlocal statements
+        statements += 1
+
+    with app.app_context():
+        engine = db.engine
+    counts = {}
+    for role, url in (('Admin', '/admin_dashboard'), ('User', '/dashboard'), ('Agent', '/agent_dashboard')):
+        client = app.test_client()
+        with client.session_transaction() as sess:
+            sess['user_id'] = ids[role]
+            sess['user_email'] = 'check@example.com'
+            sess['user_role'] = role
+        # The first request warms per-process caches (notification settings, pricing)
+        client.get(url)
+        statements = 0
+        event.listen(engine, 'before_cursor_execute', count_statement)
+        try:
+            resp = client.get(url)
+        finally:
+            event.remove(engine, 'before_cursor_execute', count_statement)
+        counts[url] = (statements, resp.status_code)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check that dashboard query counts do not grow with the data.')
+    parser.add_argument('--small', type=int, default=20, help='couriers per user/agent for the first count')
+    parser.add_argument('--large', type=int, default=200, help='couriers per user/agent for the second count')
+    parser.add_argument('--create-tables', action='store_true',
+                        help='create missing tables first (for a scratch DATABASE_URL)')
+    args = parser.parse_args()
+    if not 0 < args.small < args.large:
+        parser.error('need 0 < --small < --large')
+
+    with app.app_context():
+        if args.create_tables:
+            db.create_all()
+        ids = create_owners(int(time.time()))
+        add_couriers(args.small, ids['User'], ids['Agent'])
+    small = count_statements(ids)
+    with app.app_context():
+        add_couriers(args.large - args.small, ids['User'], ids['Agent'])
+    large = count_statements(ids)
+
+    failures = []
+    report = {}
+    for url in small:
+        (before, status_before), (after, status_after) = small[url], large[url]
+        report[url] = {f'statements_{args.small}': before, f'statements_{args.large}': after}
+        if status_before != 200 or status_after != 200:
+            failures.append(f'{url} returned {status_before}/{status_after}')
+        elif after != before:
+            failures.append(f'{url} went from {before} to {after} statements')
+    print(json.dumps(report, indent=2))
+    for failure in failures:
+        print('FAIL: ' + failure, file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
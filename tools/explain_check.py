@@ -0,0 +1,152 @@
+"""
+Capture EXPLAIN plans for the queries each route issues and flag full table scans.
+
+Usage (from project root, against a seeded MySQL database with migrations applied):
+
+    python tools/explain_check.py
+    python tools/explain_check.py --json explain_report.json --strict
+
+This script will:
+ - import the Flask app and drive the read routes through the Flask test client,
+   logged in as the first admin, a user with couriers and an agent with couriers
+ - record every SELECT the routes send to MySQL (plus the create_courier pricing lookup)
+ - run EXPLAIN for each captured statement with its original parameters
+ - exit with status 1 if any filtered statement falls back to a full table scan
+   (access type ALL with no usable index; with --strict, any ALL at all)
+
+Statements without a WHERE clause (e.g. listing all delivery agents) are reported but
+not treated as failures: they read the whole table by design.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from urllib.parse import urlencode
+
+# Ensure project root (one level up from tools/) is on sys.path so we can import app
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from sqlalchemy import event
+
+try:
+    from app import app, db, Admin, User, DeliveryAgent, Courier, CourierPricing
+except Exception as e:
+    print('Error importing app from project root:', e)
+    print('Make sure you run this script from the project root or use the provided instructions.')
+    raise
+
+
+def login(client, role, user_id, email):
+    with client.session_transaction() as sess:
+        sess['user_id'] = user_id
+        sess['user_email'] = email
+        sess['user_role'] = role
+
+
+def route_plan():
+    """Return [(name, role, principal, url)] for the routes to exercise."""
+    admin = Admin.query.order_by(Admin.aid).first()
+    courier = Courier.query.filter(Courier.uid.isnot(None)).order_by(Courier.cid).first()
+    assigned = Courier.query.filter(Courier.agentid.isnot(None)).order_by(Courier.cid).first()
+    if not admin or not courier or not assigned:
+        raise SystemExit('Seed the database first: need an admin, a courier with a user and an assigned courier.')
+    user = User.query.get(courier.uid)
+    agent = DeliveryAgent.query.get(assigned.agentid)
+
+    return [
+        ('track_courier', None, None, f'/track_courier?tracking_number={courier.billno}'),
+        ('api_tracking', None, None, f'/api/tracking?billnos={courier.billno},{assigned.billno}'),
+        ('dashboard', 'User', user, '/dashboard'),
+        ('payment', 'User', user, f'/payment/{courier.cid}'),
+        ('agent_dashboard', 'Agent', agent, '/agent_dashboard'),
+        ('admin_dashboard', 'Admin', admin, '/admin_dashboard'),
+        ('admin_api_couriers', 'Admin', admin, '/admin/api/couriers'),
+        ('admin_api_couriers?status', 'Admin', admin, '/admin/api/couriers?status=Pending'),
+        ('admin_api_couriers?type', 'Admin', admin, '/admin/api/couriers?type=Domestic'),
+        ('admin_api_couriers?agent=none', 'Admin', admin, '/admin/api/couriers?agent=none'),
+        ('admin_api_couriers?agent', 'Admin', admin, f'/admin/api/couriers?agent={agent.agentid}'),
+        ('admin_api_payments', 'Admin', admin, '/admin/api/payments'),
+        ('admin_api_payments?status', 'Admin', admin, '/admin/api/payments?status=Completed'),
+        ('admin_api_users', 'Admin', admin, '/admin/api/users'),
+        ('courier_search?billno', 'Admin', admin, f'/admin/api/couriers/search?q={courier.billno}'),
+        ('courier_search?phone_suffix', 'Admin', admin,
+         '/admin/api/couriers/search?' + urlencode({'q': re.sub(r'\D', '', courier.rphone)[-4:]})),
+        ('courier_search?email', 'Admin', admin, '/admin/api/couriers/search?' + urlencode({'q': courier.semail[:6]})),
+        ('courier_search?name', 'Admin', admin, '/admin/api/couriers/search?' + urlencode({'q': courier.sname.split()[0]})),
+    ]
+
+
+def capture(name, fn, captured):
+    """Run fn() and append every SELECT it sends to the database to captured."""
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            captured.append((name, statement, parameters))
+
+    event.listen(db.engine, 'before_cursor_execute', listener)
+    try:
+        fn()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', listener)
+
+
+def explain(statement, parameters):
+    raw = db.engine.raw_connection()
+    try:
+        cur = raw.cursor()
+        cur.execute('EXPLAIN ' + statement, parameters)
+        columns = [d[0] for d in cur.description]
+        return [dict(zip(columns, row)) for row in cur.fetchall()]
+    finally:
+        raw.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='EXPLAIN every route query and flag full scans.')
+    parser.add_argument('--json', help='write the full report to this file')
+    parser.add_argument('--strict', action='store_true', help='fail on any ALL access, even if an index was considered')
+    args = parser.parse_args()
+
+    captured = []
+    with app.app_context():
+        for name, role, principal, url in route_plan():
+            client = app.test_client()
+            if role:
+                principal_id = {'Admin': 'aid', 'User': 'uid', 'Agent': 'agentid'}[role]
+                login(client, role, getattr(principal, principal_id), principal.email)
+            capture(name, lambda: client.get(url), captured)
+
+        # create_courier is a write route; capture just its pricing lookup
+        capture('create_courier (pricing)', lambda: CourierPricing.query.filter(
+            CourierPricing.courier_type == 'Domestic',
+            CourierPricing.min_weight <= 2.5,
+            CourierPricing.max_weight >= 2.5,
+        ).first(), captured)
+
+        report = []
+        failures = 0
+        for name, statement, parameters in captured:
+            plan = explain(statement, parameters)
+            filtered = ' WHERE ' in statement.upper()
+            bad = [row for row in plan if row.get('type') == 'ALL'
+                   and (args.strict or not row.get('possible_keys'))]
+            failed = bool(bad) and filtered
+            failures += failed
+            report.append({'route': name, 'statement': statement, 'plan': plan, 'full_scan': failed})
+            status = 'FULL SCAN' if failed else 'ok'
+            accesses = ', '.join(f"{row.get('table')}:{row.get('type')}/{row.get('key')}" for row in plan)
+            print(f'[{status:9}] {name:30} {accesses}')
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as fh:
+            json.dump(report, fh, indent=2, default=str)
+
+    print(f'{len(captured)} statements explained, {failures} full table scan(s).')
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,319 @@
+"""
+Generate a large synthetic dataset (admins, users, credentials, agents, couriers, tracking,
+payments) for capacity testing.
+
+Usage (from project root, against a scratch database with migrations applied):
+
+    python tools/generate_data.py --users 200000 --couriers 2000000 --processes 8
+    python tools/generate_data.py --couriers 1000000 --method load-data
+
+    # quick local run without MySQL
+    DATABASE_URL=sqlite:////tmp/gen.db python tools/generate_data.py --create-tables --users 2000 --couriers 20000
+
+This script will:
+ - pick primary keys after the current MAX(id) of each table and reserve one contiguous
+   range of bill numbers from Billno_sequence, so rows from different processes never
+   collide and every foreign key points at a row that exists
+ - insert admins, delivery agents and pricing bands (if missing) from the main process
+ - split users (with their Credentials) and then couriers (with 1-N tracking rows that
+   follow the status lifecycle, and one payment each) into chunks, and write the chunks
+   from --processes worker processes, one transaction per chunk
+ - write each chunk with multi-row INSERTs (--method insert, default) or by streaming it
+   to a temporary CSV file and loading that with LOAD DATA LOCAL INFILE (--method
+   load-data, MySQL only; the server needs local_infile=ON)
+ - print rows written and rows per second per table as JSON
+
+Every generated login shares one password (--password, default 'password'), hashed once,
+because hashing millions of distinct passwords would dominate the run. Run it against an
+idle database: the id ranges are computed when the run starts.
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Ensure project root (one level up from tools/) is on sys.path so we can import app
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+os.environ.setdefault('NOTIFY_DISPATCHER', 'external')
+
+from sqlalchemy import create_engine, func
+from werkzeug.security import generate_password_hash
+
+try:
+    from app import (app, db, Admin, User, Credentials, DeliveryAgent, Courier, CourierTracking,
+                     Payment, CourierPricing, billno_allocator)
+except Exception as e:
+    print('Error importing app from project root:', e)
+    print('Make sure you run this script from the project root or use the provided instructions.')
+    raise
+
+from seed_data import CITIES, pricing_rows, tracking_path
+
+FIRST_NAMES = ('Aarav', 'Vivaan', 'Aditya', 'Vihaan', 'Arjun', 'Sai', 'Reyansh', 'Krishna', 'Ishaan', 'Rohan',
+               'Ananya', 'Diya', 'Priya', 'Kavya', 'Meera', 'Saanvi', 'Aditi', 'Pooja', 'Neha', 'Riya')
+LAST_NAMES = ('Sharma', 'Verma', 'Iyer', 'Reddy', 'Nair', 'Gupta', 'Patel', 'Singh', 'Khan', 'Das',
+              'Menon', 'Joshi', 'Kulkarni', 'Bose', 'Rao')
+STREETS = ('MG Road', 'Park Street', 'Station Road', 'Church Street', 'Nehru Nagar', 'Gandhi Marg', 'Lake View')
+COUNTRIES = ('UAE', 'USA', 'UK', 'Singapore', 'Germany', 'Australia')
+STATUS_WEIGHTS = {'Pending': 12, 'Payment Received': 10, 'Out for Delivery': 15, 'In Transit': 13,
+                  'Delivered': 47, 'Cancelled': 3}
+
+
+def person(rng):
+    return f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}'
+
+
+def phone(rng):
+    return str(rng.randint(6000000000, 9999999999))
+
+
+def address(rng, city):
+    return f'{rng.randint(1, 999)} {rng.choice(STREETS)}, {city}'
+
+
+# Chunk writers ---------------------------------------------------------------------------
+
+def write_rows(conn, table, rows, method):
+    """Write a list of dicts to table with one multi-row INSERT or a LOAD DATA of a temp CSV."""
+    if not rows:
+        return
+    if method == 'insert':
+        conn.execute(table.insert(), rows)
+        return
+    columns = list(rows[0])
+    with tempfile.NamedTemporaryFile('w', suffix='.csv', newline='', encoding='utf-8', delete=False) as fh:
+        writer = csv.writer(fh, lineterminator='\n')
+        for row in rows:
+            writer.writerow(['NULL' if row[c] is None else row[c] for c in columns])
+        path = fh.name
+    try:
+        conn.exec_driver_sql(
+            f"LOAD DATA LOCAL INFILE '{path}' INTO TABLE {table.name} CHARACTER SET utf8mb4 "
+            "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' LINES TERMINATED BY '\\n' "
+            f"({', '.join(columns)})"
+        )
+    finally:
+        os.remove(path)
+
+
+_engine = None
+
+
+def worker_engine():
+    """One engine per worker process (LOAD DATA LOCAL needs it enabled on the connection)."""
+    global _engine
+    if _engine is None:
+        url = app.config['SQLALCHEMY_DATABASE_URI']
+        connect_args = {'allow_local_infile': True} if url.startswith('mysql') else {}
+        _engine = create_engine(url, connect_args=connect_args, pool_size=1, max_overflow=0) \
+            if not url.startswith('sqlite') else create_engine(url, connect_args={'timeout': 60})
+    return _engine
+
+
+def users_chunk(task):
+    """Insert users [start, end) with their credentials. Returns {table: rows}."""
+    start, end, plan = task
+    rng = random.Random(plan['seed'] * 7919 + start)
+    users, creds = [], []
+    for i in range(start, end):
+        uid = plan['uid_base'] + i
+        name = person(rng)
+        email = f"{name.lower().replace(' ', '.')}.{uid}@example.com"
+        users.append({'uid': uid, 'email': email, 'name': name, 'phoneno': phone(rng),
+                      'aid': rng.choice(plan['admin_ids'])})
+        creds.append({'email': email, 'password': plan['password_hash'], 'role': 'User', 'uid': uid, 'aid': None})
+    with worker_engine().begin() as conn:
+        write_rows(conn, User.__table__, users, plan['method'])
+        write_rows(conn, Credentials.__table__, creds, plan['method'])
+    return {'User': len(users), 'Credentials': len(creds)}
+
+
+def couriers_chunk(task):
+    """Insert couriers [start, end) with their tracking rows and payments. Returns {table: rows}."""
+    start, end, plan = task
+    rng = random.Random(plan['seed'] * 104729 + start)
+    statuses, weights = zip(*STATUS_WEIGHTS.items())
+    now = datetime.fromisoformat(plan['now'])
+    couriers, tracking, payments, paid = [], [], [], []
+    for i in range(start, end):
+        cid = plan['cid_base'] + i
+        status = rng.choices(statuses, weights)[0]
+        international = rng.random() < 0.08
+        ctype = 'International' if international else 'Domestic'
+        src = rng.choice(CITIES)
+        dst = rng.choice(COUNTRIES) if international else rng.choice([c for c in CITIES if c != src])
+        weight = round(rng.uniform(0.1, 50 if international else 25), 2)
+        booked = now - timedelta(days=rng.randrange(plan['days']), seconds=rng.randrange(86400))
+        path = tracking_path(status, plan['max_tracking'], rng)
+        times = [booked]
+        for _ in path[1:]:
+            times.append(times[-1] + timedelta(hours=rng.randint(2, 30)))
+        locations = [src] + [f'{dst} Hub' if step < len(path) - 1 else dst for step in range(1, len(path))]
+        if path[-1] in ('Out for Delivery', 'In Transit', 'Delivered'):
+            agentid = rng.choice(plan['agents_by_city'].get(dst) or plan['agent_ids'])
+        else:
+            agentid = None
+        uid = plan['uid_base'] + rng.randrange(plan['users']) if plan['users'] else rng.choice(plan['existing_uids'])
+        band = next((b for b in plan['pricing'] if b[1] == ctype and b[2] <= weight <= b[3]), None)
+        sname, rname = person(rng), person(rng)
+        couriers.append({
+            'cid': cid, 'uid': uid,
+            'semail': f"{sname.lower().replace(' ', '.')}@example.com",
+            'remail': f"{rname.lower().replace(' ', '.')}@example.com",
+            'sname': sname, 'rname': rname, 'sphone': phone(rng), 'rphone': phone(rng),
+            'saddress': address(rng, src), 'raddress': address(rng, dst), 'weight': weight,
+            'billno': plan['billno_base'] + i, 'courier_type': ctype,
+            'country': dst if international else 'India', 'date': booked.date(),
+            'agentid': agentid, 'priceid': band[0] if band else None,
+            'current_status': path[-1], 'current_location': locations[-1],
+            'status_updated_at': times[-1],
+        })
+        for tstatus, when, location in zip(path, times, locations):
+            tracking.append({'cid': cid, 'status': tstatus, 'current_location': location, 'updated_at': when})
+        amount = band[4] if band else 100
+        is_paid = path[-1] not in ('Pending', 'Cancelled')
+        # Inserted as Pending and completed with one UPDATE below, so trg_payments_after_insert
+        # does not append a 'Payment Received' event dated today to historical couriers.
+        payments.append({'cid': cid, 'uid': uid, 'amount': amount,
+                         'payment_mode': rng.choice(('UPI', 'Credit Card', 'Debit Card', 'Net Banking'))
+                         if is_paid else None,
+                         'payment_status': 'Pending', 'transaction_date': times[1] if is_paid else booked})
+        if is_paid:
+            paid.append(cid)
+    payments_table = Payment.__table__
+    with worker_engine().begin() as conn:
+        write_rows(conn, Courier.__table__, couriers, plan['method'])
+        write_rows(conn, CourierTracking.__table__, tracking, plan['method'])
+        write_rows(conn, payments_table, payments, plan['method'])
+        if paid:
+            conn.execute(payments_table.update().where(payments_table.c.cid.in_(paid))
+                         .values(payment_status='Completed'))
+    return {'Courier': len(couriers), 'Courier_tracking': len(tracking), 'Payments': len(payments)}
+
+
+# Main process ----------------------------------------------------------------------------
+
+def next_id(column):
+    return (db.session.execute(db.select(func.max(column))).scalar() or 0) + 1
+
+
+def prepare(args, password_hash):
+    """Insert the small tables and return the plan shared with the workers."""
+    rng = random.Random(args.seed)
+    if not CourierPricing.query.first():
+        db.session.execute(CourierPricing.__table__.insert(), pricing_rows())
+    pricing = [(p.priceid, p.courier_type, float(p.min_weight), float(p.max_weight), float(p.base_price))
+               for p in CourierPricing.query.all()]
+
+    aid_base = next_id(Admin.aid)
+    admins = [{'aid': aid_base + i, 'email': f'admin{aid_base + i}@courier.example.com', 'name': person(rng),
+               'phoneno': phone(rng)} for i in range(args.admins)]
+    agent_base = next_id(DeliveryAgent.agentid)
+    agents = [{'agentid': agent_base + i, 'name': person(rng), 'email': f'agent{agent_base + i}@courier.example.com',
+               'phone': phone(rng), 'assigned_area': CITIES[i % len(CITIES)]} for i in range(args.agents)]
+    if admins:
+        db.session.execute(Admin.__table__.insert(), admins)
+        db.session.execute(Credentials.__table__.insert(), [
+            {'email': a['email'], 'password': password_hash, 'role': 'Admin', 'uid': None, 'aid': a['aid']}
+            for a in admins])
+    if agents:
+        db.session.execute(DeliveryAgent.__table__.insert(), agents)
+    db.session.commit()
+
+    admin_ids = [a for (a,) in db.session.execute(db.select(Admin.aid))]
+    agent_rows = db.session.execute(db.select(DeliveryAgent.agentid, DeliveryAgent.assigned_area)).all()
+    agents_by_city = {}
+    for agentid, area in agent_rows:
+        agents_by_city.setdefault(area, []).append(agentid)
+    existing_uids = [] if args.users else [u for (u,) in db.session.execute(db.select(User.uid).limit(10000))]
+    if not admin_ids or not agent_rows or not (args.users or existing_uids):
+        raise SystemExit('Need at least one admin, one delivery agent and one user (use --admins/--agents/--users).')
+
+    return {
+        'seed': args.seed, 'method': args.method, 'password_hash': password_hash,
+        'uid_base': next_id(User.uid), 'users': args.users, 'existing_uids': existing_uids,
+        'cid_base': next_id(Courier.cid),
+        'billno_base': billno_allocator.reserve_range(args.couriers).start if args.couriers else 0,
+        'admin_ids': admin_ids, 'agent_ids': [a for a, _ in agent_rows], 'agents_by_city': agents_by_city,
+        'pricing': pricing, 'max_tracking': args.max_tracking, 'days': args.days,
+        'now': datetime.now().replace(microsecond=0).isoformat(),
+    }, {'Admin': len(admins), 'Credentials': len(admins), 'Delivery_agent': len(agents)}
+
+
+def run_phase(pool, fn, total, chunk, plan, counts, label):
+    """Run fn over [0, total) in chunks on the pool; add to counts and return rows per second."""
+    tasks = [(start, min(start + chunk, total), plan) for start in range(0, total, chunk)]
+    started = time.perf_counter()
+    written = done = 0
+    for result in pool.imap_unordered(fn, tasks):
+        for table, rows in result.items():
+            counts[table] = counts.get(table, 0) + rows
+            written += rows
+        done += 1
+        if done % max(1, len(tasks) // 20) == 0 or done == len(tasks):
+            print(f'  {label}: {done}/{len(tasks)} chunks', file=sys.stderr)
+    return round(written / (time.perf_counter() - started), 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate synthetic data for capacity testing.')
+    parser.add_argument('--admins', type=int, default=5)
+    parser.add_argument('--agents', type=int, default=200)
+    parser.add_argument('--users', type=int, default=100000)
+    parser.add_argument('--couriers', type=int, default=1000000)
+    parser.add_argument('--max-tracking', type=int, default=6, help='tracking rows per courier, at most')
+    parser.add_argument('--days', type=int, default=730, help='spread booking dates over this many days')
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 4)
+    parser.add_argument('--chunk-size', type=int, default=5000, help='rows per transaction (default: 5000)')
+    parser.add_argument('--method', choices=('insert', 'load-data'), default='insert')
+    parser.add_argument('--password', default='password', help='password for every generated login')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--create-tables', action='store_true',
+                        help='create missing tables first (for a scratch DATABASE_URL)')
+    args = parser.parse_args()
+
+    if args.method == 'load-data' and not app.config['SQLALCHEMY_DATABASE_URI'].startswith('mysql'):
+        parser.error('--method load-data needs a MySQL DATABASE_URL')
+
+    started = time.perf_counter()
+    with app.app_context():
+        if args.create_tables:
+            db.create_all()
+        plan, counts = prepare(args, generate_password_hash(args.password))
+        db.session.remove()
+        db.engine.dispose()
+
+    phase_rate = {}
+    ctx = multiprocessing.get_context('spawn')
+    with ctx.Pool(args.processes) as pool:
+        if args.users:
+            phase_rate['users'] = run_phase(pool, users_chunk, args.users, args.chunk_size, plan, counts, 'users')
+        if args.couriers:
+            phase_rate['couriers'] = run_phase(pool, couriers_chunk, args.couriers, args.chunk_size, plan, counts,
+                                            'couriers')
+    elapsed = time.perf_counter() - started
+
+    total = sum(counts.values())
+    print(json.dumps({
+        'method': args.method,
+        'processes': args.processes,
+        'rows': counts,
+        'total_rows': total,
+        'elapsed_sec': round(elapsed, 1),
+        'rows_per_sec': round(total / elapsed, 1),
+        'phase_rows_per_sec': phase_rate,
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
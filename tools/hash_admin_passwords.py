@@ -1,21 +1,35 @@
 """
-One-off helper: hash seeded admin passwords in the Credentials table.
+Hash plaintext passwords in the Credentials table (admins and users).
 
-Usage (from project root d:\dbms\project\code):
+Usage (from project root d:\\dbms\\project\\code):
 
-    python tools\hash_admin_passwords.py
+    python tools\\hash_admin_passwords.py
+    python tools\\hash_admin_passwords.py --role Admin
+    python tools\\hash_admin_passwords.py --processes 8 --chunk-size 2000
+    python tools\\hash_admin_passwords.py --dry-run
 
 This script will:
  - import the Flask app and SQLAlchemy `db` from app.py
- - find all Credentials rows with role='Admin'
- - if the stored password doesn't look hashed (werkzeug default 'pbkdf2:' prefix), it will hash it
- - commit the changes and print a summary
+ - walk the Credentials rows whose password is not hashed yet, in email order, one chunk
+   at a time (keyset pagination, so memory use does not grow with the table)
+ - hash each chunk on a pool of worker processes with generate_password_hash, using the
+   app's PASSWORD_HASH_METHOD so logins do not hash them again
+ - write the chunk back and commit it before reading the next one, printing progress and
+   rows per second
 
-IMPORTANT: Run this once. Do NOT run repeatedly unless you understand the stored passwords.
+It is safe to stop and re-run: rows that are already hashed are skipped, and each row is
+only updated if its password is still the plaintext that was read, so a password changed
+meanwhile is never overwritten. Pass --after <email> (printed on interruption) to resume
+without rescanning the rows before it.
 """
 
+import argparse
 import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from sqlalchemy import and_, bindparam, not_, or_
 from werkzeug.security import generate_password_hash
 
 # Ensure project root (one level up from tools/) is on sys.path so we can import app
@@ -24,42 +38,96 @@ if BASE_DIR not in sys.path:
     sys.path.insert(0, BASE_DIR)
 
 try:
-    from app import app, db, Credentials
+    from app import app, db, Credentials, PASSWORD_HASH_PREFIXES, is_plaintext_password
 except Exception as e:
     print('Error importing app from project root:', e)
     print('Make sure you run this script from the project root or use the provided instructions.')
     raise
 
-def looks_hashed(pw: str) -> bool:
-    # Werkzeug's generate_password_hash produces strings like 'pbkdf2:sha256:...'
-    return isinstance(pw, str) and (pw.startswith('pbkdf2:') or pw.startswith('argon2:'))
+def hash_batch(args):
+    """Worker: hash a list of plaintext passwords with the given method."""
+    passwords, method = args
+    return [generate_password_hash(pw, method=method) for pw in passwords]
+
+
+def unhashed_after(last_email, role, limit):
+    """Read the next chunk of credentials in email order that may hold plaintext.
+
+    Returns (rows with a plaintext password, last email read, or None at the end). Values
+    shaped like another scheme's hash are left alone, like the app's login does.
+    """
+    pw = Credentials.password
+    query = (db.select(Credentials.email, Credentials.password)
+             .where(Credentials.email > last_email, pw.isnot(None), pw != '',
+                    not_(or_(*[pw.like(prefix + '%') for prefix in PASSWORD_HASH_PREFIXES])))
+             .order_by(Credentials.email)
+             .limit(limit))
+    if role != 'all':
+        query = query.where(Credentials.role == role)
+    rows = db.session.execute(query).all()
+    return [r for r in rows if is_plaintext_password(r.password)], (rows[-1].email if rows else None)
 
 
 def main():
-    updated = []
+    parser = argparse.ArgumentParser(description='Hash plaintext passwords in Credentials.')
+    parser.add_argument('--role', choices=('all', 'Admin', 'User'), default='all')
+    parser.add_argument('--chunk-size', type=int, default=1000, help='rows per transaction (default: 1000)')
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 2)
+    parser.add_argument('--method', default=app.config['PASSWORD_HASH_METHOD'],
+                        help="hash method for generate_password_hash (default: the app's PASSWORD_HASH_METHOD, "
+                             f"{app.config['PASSWORD_HASH_METHOD']}, so logins do not re-hash)")
+    parser.add_argument('--after', default='', help='resume after this email')
+    parser.add_argument('--dry-run', action='store_true', help='only count the rows that need hashing')
+    args = parser.parse_args()
+
     with app.app_context():
-        admins = Credentials.query.filter_by(role='Admin').all()
-        if not admins:
-            print('No admin credentials found.')
+        if args.dry_run:
+            total, last = 0, args.after
+            while last is not None:
+                rows, last = unhashed_after(last, args.role, 10000)
+                total += len(rows)
+            print(f'{total} credential row(s) have plaintext passwords.')
             return
-        for cred in admins:
-            if cred.password is None:
-                print(f"Skipping {cred.email}: empty password")
-                continue
-            if looks_hashed(cred.password):
-                print(f"Already hashed: {cred.email}")
-                continue
-            # Hash and update
-            old = cred.password
-            cred.password = generate_password_hash(old)
-            updated.append(cred.email)
-        if updated:
-            db.session.commit()
-            print('Updated (hashed) the following admin emails:')
-            for e in updated:
-                print(' -', e)
+
+        table = Credentials.__table__
+        update = (table.update()
+                  .where(and_(table.c.email == bindparam('b_email'), table.c.password == bindparam('b_old')))
+                  .values(password=bindparam('b_new')))
+
+        started = time.perf_counter()
+        last, hashed, skipped = args.after, 0, 0
+        with ProcessPoolExecutor(max_workers=args.processes) as pool:
+            try:
+                while True:
+                    rows, next_last = unhashed_after(last, args.role, args.chunk_size)
+                    if next_last is None:
+                        break
+                    if rows:
+                        # Split the chunk evenly over the workers: one task each
+                        step = -(-len(rows) // args.processes)
+                        batches = [([r.password for r in rows[i:i + step]], args.method)
+                                   for i in range(0, len(rows), step)]
+                        new_hashes = [h for batch in pool.map(hash_batch, batches) for h in batch]
+                        result = db.session.execute(update, [
+                            {'b_email': r.email, 'b_old': r.password, 'b_new': h} for r, h in zip(rows, new_hashes)])
+                        db.session.commit()
+                        changed = result.rowcount if result.rowcount is not None and result.rowcount >= 0 else len(rows)
+                        hashed += changed
+                        skipped += len(rows) - changed
+                        elapsed = time.perf_counter() - started
+                        print(f'{hashed} hashed ({hashed / elapsed:.1f} rows/sec), last email {next_last}')
+                    last = next_last
+            except KeyboardInterrupt:
+                db.session.rollback()
+                print(f'Interrupted. Resume with: --after "{last}"')
+                sys.exit(1)
+
+        elapsed = time.perf_counter() - started
+        if hashed or skipped:
+            print(f'Done: hashed {hashed} password(s) in {elapsed:.1f}s '
+                  f'({hashed / elapsed:.1f} rows/sec); {skipped} changed meanwhile and were left alone.')
         else:
-            print('No admin passwords needed hashing.')
+            print('No passwords needed hashing.')
 
 if __name__ == '__main__':
     main()
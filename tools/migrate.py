@@ -0,0 +1,93 @@
+"""
+Apply versioned schema migrations from migrations/ to the app database.
+
+Usage (from project root):
+
+    python tools/migrate.py            # apply pending migrations
+    python tools/migrate.py --status   # list applied / pending migrations
+
+This script will:
+ - import the Flask app and SQLAlchemy `db` from app.py
+ - create the Schema_migrations bookkeeping table if needed
+ - run every migrations/NNN_*.sql file that is not recorded there yet, in order,
+   recording each one after it succeeds
+
+Migration files contain plain SQL statements separated by ';' (no DELIMITER blocks).
+Stored procedures, functions, views and triggers stay in trigger_procedure.sql; re-run
+that script after migrating so the routines match the new schema.
+"""
+
+import argparse
+import os
+import sys
+
+# Ensure project root (one level up from tools/) is on sys.path so we can import app
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from sqlalchemy import text
+
+try:
+    from app import app, db
+except Exception as e:
+    print('Error importing app from project root:', e)
+    print('Make sure you run this script from the project root or use the provided instructions.')
+    raise
+
+MIGRATIONS_DIR = os.path.join(BASE_DIR, 'migrations')
+
+
+def migration_files():
+    return sorted(f for f in os.listdir(MIGRATIONS_DIR) if f.endswith('.sql') and f[:3].isdigit())
+
+
+def statements(path):
+    """Split a migration file into statements, dropping '--' comment lines."""
+    with open(path, encoding='utf-8') as fh:
+        lines = [line for line in fh if not line.lstrip().startswith('--')]
+    return [stmt.strip() for stmt in ''.join(lines).split(';') if stmt.strip()]
+
+
+def applied_versions(conn):
+    conn.execute(text(
+        'CREATE TABLE IF NOT EXISTS Schema_migrations ('
+        ' version VARCHAR(100) PRIMARY KEY,'
+        ' applied_at DATETIME DEFAULT CURRENT_TIMESTAMP'
+        ') ENGINE=InnoDB'
+    ))
+    return {row[0] for row in conn.execute(text('SELECT version FROM Schema_migrations'))}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Apply schema migrations.')
+    parser.add_argument('--status', action='store_true', help='only list applied and pending migrations')
+    args = parser.parse_args()
+
+    with app.app_context():
+        with db.engine.begin() as conn:
+            done = applied_versions(conn)
+        pending = [f for f in migration_files() if f not in done]
+
+        if args.status:
+            for name in migration_files():
+                print(('applied  ' if name in done else 'pending  ') + name)
+            return
+
+        if not pending:
+            print('Schema is up to date.')
+            return
+
+        for name in pending:
+            print('Applying', name)
+            # MySQL commits DDL implicitly, so a failed migration may be partially applied;
+            # each file is recorded only after all of its statements succeed.
+            with db.engine.begin() as conn:
+                for stmt in statements(os.path.join(MIGRATIONS_DIR, name)):
+                    conn.exec_driver_sql(stmt)
+                conn.execute(text('INSERT INTO Schema_migrations (version) VALUES (:v)'), {'v': name})
+        print(f'Applied {len(pending)} migration(s). Re-run trigger_procedure.sql to refresh routines.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+"""
+Shared reference data for the tools that seed synthetic couriers (bench_routes.py,
+generate_data.py): cities, pricing bands and the courier status lifecycle.
+
+Not a script; the tools in this directory import it.
+"""
+
+CITIES = ('Mumbai', 'Delhi', 'Bengaluru', 'Chennai', 'Kolkata', 'Hyderabad', 'Pune', 'Jaipur', 'Lucknow',
+          'Ahmedabad', 'Kochi', 'Indore', 'Bhopal', 'Nagpur', 'Surat')
+STATUS_PATH = ('Pending', 'Payment Received', 'Out for Delivery', 'In Transit', 'Delivered')
+# (courier_type, min_weight, max_weight, base_price, price_per_km)
+PRICING = [('Domestic', 0.01, 1, 50, 2), ('Domestic', 1.01, 5, 120, 3), ('Domestic', 5.01, 20, 300, 4),
+           ('Domestic', 20.01, 50, 700, 5), ('International', 0.01, 5, 1500, 10),
+           ('International', 5.01, 50, 5000, 15)]
+
+
+def pricing_rows():
+    """PRICING as Courier_pricing rows for a multi-row insert."""
+    return [{'courier_type': t, 'min_weight': lo, 'max_weight': hi, 'base_price': base, 'price_per_km': per_km}
+            for t, lo, hi, base, per_km in PRICING]
+
+
+def tracking_path(status, max_rows, rng=None):
+    """Statuses from booking to `status`.
+
+    Couriers in transit or delivered get extra 'In Transit' hops: enough to fill max_rows
+    rows, or a random number up to that when rng is given.
+    """
+    if status == 'Cancelled':
+        return ['Pending', 'Cancelled']
+    path = list(STATUS_PATH[:STATUS_PATH.index(status) + 1])
+    if status in ('In Transit', 'Delivered'):
+        extra = max(0, max_rows - len(path))
+        for _ in range(rng.randint(0, extra) if rng else extra):
+            path.insert(-1, 'In Transit')
+    return path
@@ -0,0 +1,105 @@
+"""
+Concurrency stress test for the bill number allocator.
+
+Usage (from project root):
+
+    python tools/stress_billno.py --processes 8 --threads 8 --per-thread 5000
+
+    # quick local run without MySQL
+    DATABASE_URL=sqlite:////tmp/billno.db python tools/stress_billno.py --create-tables
+
+This script will:
+ - start --processes worker processes, each importing the app and running --threads
+   threads that call allocate_billno() --per-thread times
+ - collect every allocated number and check that there are no duplicates
+ - print a JSON summary with allocations per second and exit 1 if any duplicate is found
+
+Each process uses the shared Billno_sequence row, so this exercises block reservation
+across processes as well as the in-process lock across threads.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+# Ensure project root (one level up from tools/) is on sys.path so we can import app
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+
+def worker(threads, per_thread, start_event, results):
+    from app import app, allocate_billno
+
+    numbers = []
+    lock = threading.Lock()
+
+    def run():
+        local = []
+        with app.app_context():
+            for _ in range(per_thread):
+                local.append(allocate_billno())
+        with lock:
+            numbers.extend(local)
+
+    start_event.wait()
+    pool = [threading.Thread(target=run) for _ in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    results.put(numbers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Stress test allocate_billno() for duplicates.')
+    parser.add_argument('--processes', type=int, default=4)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--per-thread', type=int, default=2000)
+    parser.add_argument('--create-tables', action='store_true',
+                        help='create missing tables first (for a scratch DATABASE_URL)')
+    args = parser.parse_args()
+
+    if args.create_tables:
+        from app import app, db
+        with app.app_context():
+            db.create_all()
+
+    ctx = multiprocessing.get_context('spawn')
+    start_event = ctx.Event()
+    results = ctx.Queue()
+    procs = [ctx.Process(target=worker, args=(args.threads, args.per_thread, start_event, results))
+             for _ in range(args.processes)]
+    for p in procs:
+        p.start()
+    # Let every process finish importing the app before the clock starts
+    time.sleep(2.0)
+    started = time.perf_counter()
+    start_event.set()
+    numbers = []
+    for _ in procs:
+        numbers.extend(results.get())
+    elapsed = time.perf_counter() - started
+    for p in procs:
+        p.join()
+
+    duplicates = {n: c for n, c in Counter(numbers).items() if c > 1}
+    print(json.dumps({
+        'processes': args.processes,
+        'threads_per_process': args.threads,
+        'allocations': len(numbers),
+        'unique': len(numbers) - sum(c - 1 for c in duplicates.values()),
+        'duplicates': len(duplicates),
+        'allocations_per_sec': round(len(numbers) / elapsed, 1),
+        'elapsed_sec': round(elapsed, 3),
+    }, indent=2))
+    sys.exit(1 if duplicates else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,13 @@
 -- Drop objects if they exist (safe to re-run)
 DROP TRIGGER IF EXISTS trg_payments_after_insert;
 DROP TRIGGER IF EXISTS trg_courier_after_update_agent;
+DROP TRIGGER IF EXISTS trg_courier_before_update_agent;
+DROP TRIGGER IF EXISTS trg_pricing_after_insert;
+DROP TRIGGER IF EXISTS trg_pricing_after_update;
+DROP TRIGGER IF EXISTS trg_pricing_after_delete;
+DROP TRIGGER IF EXISTS trg_payments_kpi_after_insert;
+DROP TRIGGER IF EXISTS trg_payments_kpi_after_update;
+DROP TRIGGER IF EXISTS trg_payments_kpi_after_delete;
 DROP PROCEDURE IF EXISTS sp_mark_payment_completed;
 DROP PROCEDURE IF EXISTS sp_assign_agent;
 DROP FUNCTION IF EXISTS fn_payment_status;
@@ -115,50 +122,75 @@ CREATE TABLE IF NOT EXISTS `Notification_config` (
   `twilio_from_number` VARCHAR(50)
 ) ENGINE=InnoDB;
 
+-- Notifications are written here in the same transaction as the tracking change and
+-- sent by the app's outbox dispatcher (see NotificationDispatcher in app.py).
+CREATE TABLE IF NOT EXISTS `Notification_outbox` (
+  `id` INT PRIMARY KEY AUTO_INCREMENT,
+  `cid` INT,
+  `channel` ENUM('email','sms') NOT NULL,
+  `recipient` VARCHAR(255) NOT NULL,
+  `subject` VARCHAR(255),
+  `body` TEXT NOT NULL,
+  `status` ENUM('Pending','Sent','Failed') NOT NULL DEFAULT 'Pending',
+  `attempts` INT NOT NULL DEFAULT 0,
+  `last_error` VARCHAR(255),
+  `created_at` DATETIME DEFAULT CURRENT_TIMESTAMP,
+  `next_attempt_at` DATETIME DEFAULT CURRENT_TIMESTAMP,
+  `sent_at` DATETIME,
+  KEY `ix_outbox_status_next` (`status`, `next_attempt_at`)
+) ENGINE=InnoDB;
+
+-- Courier.current_status / current_location / status_updated_at mirror the latest
+-- Courier_tracking row (migrations/001_courier_current_status.sql). Every routine below
+-- that inserts a tracking row also updates those columns, and reads use them instead of
+-- sorting Courier_tracking.
+
 -- VIEWS
 CREATE OR REPLACE VIEW vw_courier_summary AS
 SELECT c.cid, c.billno, c.sname, c.rname, p.amount, p.payment_status,
-  (SELECT ct.status FROM Courier_tracking ct WHERE ct.cid = c.cid ORDER BY ct.updated_at DESC LIMIT 1) AS last_status,
+  c.current_status AS last_status,
   c.agentid
 FROM Courier c
 LEFT JOIN Payments p ON p.cid = c.cid;
 
+-- active_count excludes delivered/cancelled shipments; the app's auto dispatcher uses it
+-- as the agent's current load.
 CREATE OR REPLACE VIEW vw_agent_assignments AS
-SELECT a.agentid, a.name AS agent_name, a.email AS agent_email, COUNT(c.cid) AS assigned_count
+SELECT a.agentid, a.name AS agent_name, a.email AS agent_email, a.assigned_area,
+  COUNT(c.cid) AS assigned_count,
+  COUNT(CASE WHEN c.cid IS NOT NULL AND (c.current_status IS NULL OR c.current_status NOT IN ('Delivered', 'Cancelled')) THEN 1 END) AS active_count
 FROM Delivery_agent a
 LEFT JOIN Courier c ON c.agentid = a.agentid
-GROUP BY a.agentid, a.name, a.email;
+GROUP BY a.agentid, a.name, a.email, a.assigned_area;
 
 -- PROCEDURES and FUNCTIONS
 DELIMITER $$
 CREATE PROCEDURE sp_mark_payment_completed(IN p_cid INT)
 BEGIN
-  -- Mark payments completed for this courier
-  UPDATE Payments SET payment_status='Completed', transaction_date=NOW() WHERE cid = p_cid;
-
-  -- Insert a tracking row if latest isn't 'Payment Received' (avoid duplicates)
   DECLARE last_status VARCHAR(100);
   DECLARE last_time DATETIME;
   DECLARE CONTINUE HANDLER FOR NOT FOUND SET last_status = NULL, last_time = NULL;
 
-  SELECT status, updated_at INTO last_status, last_time
-    FROM Courier_tracking WHERE cid = p_cid ORDER BY updated_at DESC LIMIT 1;
+  -- Mark payments completed for this courier
+  UPDATE Payments SET payment_status='Completed', transaction_date=NOW() WHERE cid = p_cid;
+
+  -- Insert a tracking row if latest isn't 'Payment Received' (avoid duplicates)
+  SELECT current_status, status_updated_at INTO last_status, last_time
+    FROM Courier WHERE cid = p_cid;
 
   IF last_status IS NULL OR last_status <> 'Payment Received' OR (last_time IS NOT NULL AND TIMESTAMPDIFF(SECOND, last_time, NOW()) > 120) THEN
     INSERT INTO Courier_tracking (cid, status, current_location, updated_at)
     VALUES (p_cid, 'Payment Received', 'Billing', NOW());
+    UPDATE Courier SET current_status = 'Payment Received', current_location = 'Billing', status_updated_at = NOW()
+    WHERE cid = p_cid;
   END IF;
 END$$
 
 CREATE PROCEDURE sp_assign_agent(IN p_cid INT, IN p_agentid INT)
 BEGIN
-  DECLARE old_agent INT;
-  SELECT agentid INTO old_agent FROM Courier WHERE cid = p_cid LIMIT 1;
-  IF old_agent IS NULL OR old_agent != p_agentid THEN
-    UPDATE Courier SET agentid = p_agentid WHERE cid = p_cid;
-    INSERT INTO Courier_tracking (cid, status, current_location, updated_at)
-    VALUES (p_cid, 'Assigned to Agent', 'Local Delivery Hub', NOW());
-  END IF;
+  -- trg_courier_before_update_agent records the 'Assigned to Agent' tracking row and
+  -- current status when agentid actually changes.
+  UPDATE Courier SET agentid = p_agentid WHERE cid = p_cid AND NOT (agentid <=> p_agentid);
 END$$
 
 CREATE FUNCTION fn_payment_status(p_cid INT) RETURNS VARCHAR(20) DETERMINISTIC
@@ -174,7 +206,7 @@ END$$
 CREATE FUNCTION fn_last_tracking_status(p_cid INT) RETURNS VARCHAR(100) DETERMINISTIC
 BEGIN
   DECLARE last_status VARCHAR(100);
-  SELECT status INTO last_status FROM Courier_tracking WHERE cid = p_cid ORDER BY updated_at DESC LIMIT 1;
+  SELECT current_status INTO last_status FROM Courier WHERE cid = p_cid;
   IF last_status IS NULL THEN
     RETURN 'No Status';
   END IF;
@@ -193,24 +225,25 @@ BEGIN
   DECLARE CONTINUE HANDLER FOR NOT FOUND SET last_status = NULL, last_time = NULL;
 
   IF NEW.payment_status = 'Completed' THEN
-    SELECT status, updated_at INTO last_status, last_time
-      FROM Courier_tracking WHERE cid = NEW.cid ORDER BY updated_at DESC LIMIT 1;
+    SELECT current_status, status_updated_at INTO last_status, last_time
+      FROM Courier WHERE cid = NEW.cid;
 
     IF last_status IS NULL OR last_status <> 'Payment Received' OR (last_time IS NOT NULL AND TIMESTAMPDIFF(SECOND, last_time, NOW()) > 120) THEN
       INSERT INTO Courier_tracking (cid, status, current_location, updated_at)
       VALUES (NEW.cid, 'Payment Received', 'Billing', NOW());
+      UPDATE Courier SET current_status = 'Payment Received', current_location = 'Billing', status_updated_at = NOW()
+      WHERE cid = NEW.cid;
     END IF;
   END IF;
 END$$
 
-CREATE TRIGGER trg_courier_after_update_agent
-AFTER UPDATE ON Courier
+-- BEFORE UPDATE so the trigger can set the courier's current status on the row being
+-- updated (an AFTER trigger may not update the table that fired it).
+CREATE TRIGGER trg_courier_before_update_agent
+BEFORE UPDATE ON Courier
 FOR EACH ROW
 BEGIN
-  DECLARE last_status VARCHAR(100);
-  DECLARE last_time DATETIME;
   DECLARE action_status VARCHAR(100);
-  DECLARE CONTINUE HANDLER FOR NOT FOUND SET last_status = NULL, last_time = NULL;
 
   IF NOT (OLD.agentid <=> NEW.agentid) THEN
     IF NEW.agentid IS NULL THEN
@@ -219,15 +252,81 @@ BEGIN
       SET action_status = 'Assigned to Agent';
     END IF;
 
-    SELECT status, updated_at INTO last_status, last_time
-      FROM Courier_tracking WHERE cid = NEW.cid ORDER BY updated_at DESC LIMIT 1;
-
-    IF last_status IS NULL OR last_status <> action_status OR (last_time IS NOT NULL AND TIMESTAMPDIFF(SECOND, last_time, NOW()) > 120) THEN
+    IF OLD.current_status IS NULL OR OLD.current_status <> action_status OR (OLD.status_updated_at IS NOT NULL AND TIMESTAMPDIFF(SECOND, OLD.status_updated_at, NOW()) > 120) THEN
       INSERT INTO Courier_tracking (cid, status, current_location, updated_at)
       VALUES (NEW.cid, action_status, 'Local Delivery Hub', NOW());
+      -- Keep a status written by the same UPDATE (e.g. the app's 'Pending' reset, whose
+      -- tracking row is written right after this one). The app always sets
+      -- status_updated_at with the status, so a reset to the status the courier already
+      -- has is recognised too.
+      IF NEW.current_status <=> OLD.current_status AND NEW.status_updated_at <=> OLD.status_updated_at THEN
+        SET NEW.current_status = action_status,
+            NEW.current_location = 'Local Delivery Hub',
+            NEW.status_updated_at = NOW();
+      END IF;
     END IF;
   END IF;
 END$$
+
+-- Any change to Courier_pricing bumps the shared 'pricing' cache version so every app
+-- worker reloads its in-memory price bands (Cache_version, migrations/003).
+CREATE TRIGGER trg_pricing_after_insert
+AFTER INSERT ON Courier_pricing
+FOR EACH ROW
+BEGIN
+  INSERT INTO Cache_version (name, version) VALUES ('pricing', 1)
+  ON DUPLICATE KEY UPDATE version = version + 1;
+END$$
+
+CREATE TRIGGER trg_pricing_after_update
+AFTER UPDATE ON Courier_pricing
+FOR EACH ROW
+BEGIN
+  INSERT INTO Cache_version (name, version) VALUES ('pricing', 1)
+  ON DUPLICATE KEY UPDATE version = version + 1;
+END$$
+
+CREATE TRIGGER trg_pricing_after_delete
+AFTER DELETE ON Courier_pricing
+FOR EACH ROW
+BEGIN
+  INSERT INTO Cache_version (name, version) VALUES ('pricing', 1)
+  ON DUPLICATE KEY UPDATE version = version + 1;
+END$$
+
+-- Keep Kpi_daily_payments (migrations/006) in step with Payments: a payment is counted
+-- under the day of its transaction_date and its current status, and moves between
+-- rollup rows when either changes (sp_mark_payment_completed updates both).
+CREATE TRIGGER trg_payments_kpi_after_insert
+AFTER INSERT ON Payments
+FOR EACH ROW
+BEGIN
+  INSERT INTO Kpi_daily_payments (day, payment_status, payments, amount)
+  VALUES (DATE(COALESCE(NEW.transaction_date, NOW())), COALESCE(NEW.payment_status, 'Pending'), 1, NEW.amount)
+  ON DUPLICATE KEY UPDATE payments = payments + 1, amount = amount + NEW.amount;
+END$$
+
+CREATE TRIGGER trg_payments_kpi_after_update
+AFTER UPDATE ON Payments
+FOR EACH ROW
+BEGIN
+  IF NOT (OLD.payment_status <=> NEW.payment_status) OR NOT (OLD.amount <=> NEW.amount)
+     OR NOT (DATE(OLD.transaction_date) <=> DATE(NEW.transaction_date)) THEN
+    UPDATE Kpi_daily_payments SET payments = payments - 1, amount = amount - OLD.amount
+    WHERE day = DATE(COALESCE(OLD.transaction_date, NOW())) AND payment_status = COALESCE(OLD.payment_status, 'Pending');
+    INSERT INTO Kpi_daily_payments (day, payment_status, payments, amount)
+    VALUES (DATE(COALESCE(NEW.transaction_date, NOW())), COALESCE(NEW.payment_status, 'Pending'), 1, NEW.amount)
+    ON DUPLICATE KEY UPDATE payments = payments + 1, amount = amount + NEW.amount;
+  END IF;
+END$$
+
+CREATE TRIGGER trg_payments_kpi_after_delete
+AFTER DELETE ON Payments
+FOR EACH ROW
+BEGIN
+  UPDATE Kpi_daily_payments SET payments = payments - 1, amount = amount - OLD.amount
+  WHERE day = DATE(COALESCE(OLD.transaction_date, NOW())) AND payment_status = COALESCE(OLD.payment_status, 'Pending');
+END$$
 DELIMITER ;
 
 -- SAMPLE DATA (optional, uncomment and adjust IDs if needed)